@@ -12,45 +12,57 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
 from dataclasses import dataclass, field
-from typing import Any, List, Optional, Union
+from enum import IntEnum
+from typing import Any, ClassVar, List, Optional, Union
+
+
+# The kind of a top-level declaration, so callers can tell declarations apart
+# with one attribute lookup
+class DeclKind(IntEnum):
+    NODE = 1
+    EDGE = 2
+    TYPE = 3
+    ANNOTATION = 4
 
 
 # Base class for all AST nodes (optional, but can be useful)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ASTNode:
     pass
 
 
 # Represents an annotation parameter in an annotation declaration
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnnotationParameter(ASTNode):
     name: str  # Parameter names are local to the annotation, so they remain strings
     type_name: "QualifiedName"  # Always qualified
 
 
 # Represents an annotation argument in an annotation usage
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnnotationArgument(ASTNode):
     value: Any  # Can be string, identifier, or number
 
 
 # Represents an annotation usage (@SomeName(arg1, arg2))
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnnotationUsage(ASTNode):
     name: "QualifiedName"  # Always qualified
     args: List[AnnotationArgument] = field(default_factory=list)
 
 
 # Represents an annotation declaration
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnnotationDeclaration(ASTNode):
+    kind: ClassVar[DeclKind] = DeclKind.ANNOTATION
     name: "QualifiedName"  # Always qualified
     parameters: List[AnnotationParameter] = field(default_factory=list)
 
 
 # Represents a property declaration (e.g., firstName: String)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PropertyDeclaration(ASTNode):
     name: str  # Property names are local to their container, so they remain strings
     type_name: "QualifiedName"  # Always qualified
@@ -58,7 +70,7 @@ class PropertyDeclaration(ASTNode):
 
 
 # Represents a qualified name (e.g., gm.CoreTypes)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QualifiedName(ASTNode):
     parts: List[str]
 
@@ -70,7 +82,9 @@ class QualifiedName(ASTNode):
         """Create a QualifiedName from a string representation."""
         if not name:
             return cls(parts=[])
-        return cls(parts=name.split("."))
+        # Intern the parts like the parser does for identifiers, so names
+        # built here and parsed names share string objects
+        return cls(parts=[sys.intern(part) for part in name.split(".")])
 
     @property
     def simple_name(self) -> str:
@@ -79,36 +93,39 @@ class QualifiedName(ASTNode):
 
 
 # Represents a namespace declaration
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NamespaceDeclaration(ASTNode):
     name: QualifiedName
 
 
 # Represents an import declaration
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImportDeclaration(ASTNode):
     module_name: QualifiedName  # Always qualified
 
 
 # Represents a type declaration (simple or complex)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TypeDeclaration(ASTNode):
+    kind: ClassVar[DeclKind] = DeclKind.TYPE
     name: QualifiedName  # Always qualified
     properties: List[PropertyDeclaration] = field(default_factory=list)
     annotations: List[AnnotationUsage] = field(default_factory=list)
 
 
 # Represents a node declaration
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NodeDeclaration(ASTNode):
+    kind: ClassVar[DeclKind] = DeclKind.NODE
     name: QualifiedName  # Always qualified
     properties: List[PropertyDeclaration] = field(default_factory=list)
     annotations: List[AnnotationUsage] = field(default_factory=list)
 
 
 # Represents an edge declaration
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EdgeDeclaration(ASTNode):
+    kind: ClassVar[DeclKind] = DeclKind.EDGE
     name: QualifiedName  # Always qualified
     source_node: QualifiedName  # Always qualified
     target_node: QualifiedName  # Always qualified
@@ -118,7 +135,7 @@ class EdgeDeclaration(ASTNode):
 
 
 # Represents the entire document/module
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Document(ASTNode):
     source_path: Optional[str] = None  # Store the file path it was loaded from
     namespace: Optional[NamespaceDeclaration] = None
@@ -21,6 +21,14 @@ from .loader import AstLoader
 from .validation import validate_asts
 
 
+def _load_root(loader: AstLoader, root_file: str):
+    """Loads root_file, reporting a file the loader rejects as a bad argument."""
+    try:
+        return loader.load(root_file)
+    except ValueError as e:  # e.g. not a .gm file
+        raise click.BadParameter(str(e), param_hint="'ROOT_FILE'") from e
+
+
 @click.group()
 def cli():
     """Graph Model DSL (GMDsl) Tool"""
@@ -44,7 +52,7 @@ def validate(root_file: str, include_paths: tuple[str]):
         click.echo(f"Include paths: {', '.join(include_paths)}")
 
     loader = AstLoader(include_paths=list(include_paths))
-    loaded_asts = loader.load(root_file)
+    loaded_asts = _load_root(loader, root_file)
 
     # Check for loading errors first
     if loader.errors:
@@ -131,7 +139,7 @@ def generate(
 
     # --- Loading ---
     loader = AstLoader(include_paths=list(include_paths))
-    loaded_asts = loader.load(root_file)
+    loaded_asts = _load_root(loader, root_file)
 
     if loader.errors:
         click.secho("Loading Errors:", fg="red", bold=True)
@@ -12,12 +12,45 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import hashlib
 import os
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Set
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Set, Tuple
 
 from . import ast
-from .parser import parse_gmdsl
+from .parser import Parser
+
+# Extensions of GMDsl source files
+_VALID_EXTS = (".gm",)
+
+# Source files are read straight from a file descriptor (see _read_source)
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+
+
+def _canon(path: str) -> str:
+    """Returns the canonical path used to key loaded documents."""
+    # Made absolute first, so a relative path never hits a cache entry made
+    # from another working directory
+    return _realpath(os.path.abspath(path))
+
+
+@functools.lru_cache(maxsize=512)
+def _realpath(path: str) -> str:
+    """os.path.realpath of an absolute path, memoized.
+
+    Every import of a file resolves to the same path, so memoizing realpath
+    saves walking its components again for each importer.
+    """
+    return os.path.realpath(path)
+
+
+def _read_source(fd: int) -> bytes:
+    """Reads a whole source file from fd, then closes fd."""
+    # FileIO.readall reads until EOF rather than trusting st_size, which is 0
+    # for pipes and procfs files
+    with open(fd, "rb", buffering=0) as f:
+        return f.readall()
 
 
 @dataclass
@@ -29,12 +62,28 @@ class LoadError:
 class AstLoader:
     """Loads and parses a root GMDsl file and its imports."""
 
-    def __init__(self, include_paths: Optional[List[str]] = None):
+    def __init__(
+        self,
+        include_paths: Optional[List[str]] = None,
+        cache: Optional[Dict[bytes, ast.Document]] = None,
+        parser: Optional[Parser] = None,
+        allow_any_extension: bool = False,
+    ):
         """
         Args:
             include_paths: Optional list of directories to search for imports.
                            The directory of the importing file is always searched first.
+            cache: Optional content-addressed parse cache (digest of the source ->
+                   parsed document). Files whose content is already in the cache
+                   are not parsed again. It may be shared between loaders.
+            parser: Optional parser to use for every file loaded. Defaults to a
+                    new Parser, created once and reused across files and loads.
+            allow_any_extension: Whether load() accepts a root file that does not
+                                 have a .gm extension.
         """
+        self.cache = cache
+        self.parser = parser or Parser()
+        self.allow_any_extension = allow_any_extension
         self.loaded_asts: Dict[str, ast.Document] = {}
         self.errors: List[LoadError] = []
         self.processing: Set[str] = set()  # To detect circular imports
@@ -42,35 +91,52 @@ class AstLoader:
 
     def _resolve_import(
         self, module_name: str, importing_file_path: str
-    ) -> Optional[str]:
-        """Finds the absolute path for an imported module name."""
+    ) -> Optional[Tuple[str, Optional[int]]]:
+        """Finds and opens an imported module.
+
+        Returns the canonical path of the module together with an open file
+        descriptor for it, which the caller must close, or None if not found.
+        Modules that are already loaded or being loaded are not opened again,
+        in which case the descriptor is None. So is the descriptor of a module
+        that exists but cannot be opened, leaving the error to be reported
+        against that module when it is loaded.
+        """
         base_dir = os.path.dirname(importing_file_path)
-        potential_rel_path = os.path.abspath(
-            os.path.join(base_dir, f"{module_name}.gm")
-        )
-
-        # 1. Check relative path first
-        if os.path.exists(potential_rel_path):
-            return potential_rel_path
-
-        # 2. Check include paths
-        for include_path in self.include_paths:
-            potential_abs_path = os.path.abspath(
-                os.path.join(include_path, f"{module_name}.gm")
-            )
-            if os.path.exists(potential_abs_path):
-                return potential_abs_path
+        # 1. Check relative path first, then 2. the include paths
+        for search_dir in (base_dir, *self.include_paths):
+            candidate = _canon(os.path.join(search_dir, f"{module_name}.gm"))
+            if candidate in self.loaded_asts or candidate in self.processing:
+                return candidate, None  # Cycle or diamond import, nothing to read
+            # Just try to open it: probing with os.path.exists first would
+            # stat every candidate twice
+            try:
+                fd = os.open(candidate, _OPEN_FLAGS)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            except OSError:
+                return candidate, None
+            return candidate, fd
 
         return None  # Not found
 
     def load(self, root_file_path: str) -> Dict[str, ast.Document]:
-        """Loads the root file and all its imports recursively."""
+        """Loads the root file and all its imports recursively.
+
+        Args:
+            root_file_path: The file to load, as a str or os.PathLike.
+
+        Raises:
+            ValueError: If root_file_path is not a .gm file and the loader does
+                        not allow any extension.
+        """
+        root_file_path = os.fspath(root_file_path)
+        if not self.allow_any_extension and not root_file_path.endswith(_VALID_EXTS):
+            raise ValueError(f"Not a GMDsl (.gm) file: {root_file_path}")
+
         self.loaded_asts = {}
         self.errors = []
         self.processing = set()
-        abs_root_path = os.path.abspath(root_file_path)
-
-        self._load_recursive(abs_root_path)
+        self._load_recursive(_canon(root_file_path))
 
         if self.errors:
             # Optionally raise an exception or handle errors as needed
@@ -80,36 +146,75 @@ class AstLoader:
 
         return self.loaded_asts
 
-    def _load_recursive(self, file_path: str):
-        """Internal recursive loading function."""
+    def load_directory(self, directory: str) -> Dict[str, ast.Document]:
+        """Loads every .gm file in a directory (not recursively) and their imports."""
+        # DirEntry carries the file type from the directory listing, so this
+        # needs no extra stat per entry
+        with os.scandir(directory) as entries:
+            file_paths = sorted(
+                entry.path
+                for entry in entries
+                if entry.is_file(follow_symlinks=False)
+                and entry.name.endswith(_VALID_EXTS)
+            )
+
+        loaded_asts: Dict[str, ast.Document] = {}
+        errors: List[LoadError] = []
+        for file_path in file_paths:
+            if _canon(file_path) in loaded_asts:
+                continue  # Already loaded as an import of an earlier file
+            loaded_asts.update(self.load(file_path))
+            errors.extend(self.errors)
+
+        self.loaded_asts = loaded_asts
+        self.errors = errors
+        return loaded_asts
+
+    def _load_recursive(self, file_path: str, fd: Optional[int] = None):
+        """Internal recursive loading function.
+
+        Args:
+            file_path: Canonical path of the file to load.
+            fd: Optional file descriptor already opened on file_path, otherwise
+                the file is opened here. It is always closed by the time this
+                returns.
+        """
         if file_path in self.loaded_asts:
+            if fd is not None:
+                os.close(fd)
             return  # Already loaded
 
         if file_path in self.processing:
+            if fd is not None:
+                os.close(fd)
             self.errors.append(
                 LoadError(f"Circular import detected: {file_path}", file_path)
             )
             return  # Avoid infinite loop
 
-        if not os.path.exists(file_path):
-            # This error might be reported by _resolve_import caller, but double-check
-            self.errors.append(LoadError(f"File not found: {file_path}", file_path))
-            return
+        if fd is None:
+            try:
+                fd = os.open(file_path, _OPEN_FLAGS)
+            except FileNotFoundError:
+                self.errors.append(LoadError(f"File not found: {file_path}", file_path))
+                return
+            except OSError as e:
+                self.errors.append(LoadError(f"Error processing file: {e}", file_path))
+                return
 
         self.processing.add(file_path)
 
         try:
-            with open(file_path, "r") as f:
-                content = f.read()
+            data = _read_source(fd)
             # TODO: Handle LarkError during parsing
-            parsed_ast = parse_gmdsl(content, source_path=file_path)
+            parsed_ast = self._parse(data, file_path)
             self.loaded_asts[file_path] = parsed_ast
 
             # Process imports
             for imp in parsed_ast.imports:
-                resolved_path = self._resolve_import(imp.module_name, file_path)
-                if resolved_path:
-                    self._load_recursive(resolved_path)
+                resolved = self._resolve_import(imp.module_name, file_path)
+                if resolved:
+                    self._load_recursive(*resolved)
                 else:
                     self.errors.append(
                         LoadError(
@@ -123,3 +228,28 @@ class AstLoader:
             self.errors.append(LoadError(f"Error processing file: {e}", file_path))
         finally:
             self.processing.remove(file_path)  # Remove from processing set once done
+
+    def _parse(self, data: bytes, file_path: str) -> ast.Document:
+        """Parses UTF-8 file content, going through the parse cache if there is one."""
+        if self.cache is None:
+            return replace(
+                self.parser.parse(data.decode("utf-8")), source_path=file_path
+            )
+
+        # Keyed on content rather than path or mtime, so identical sources share
+        # one parse and a file rewritten within the same mtime tick is never
+        # served a stale AST. Hashing the raw bytes means a hit needs no decode.
+        key = hashlib.blake2b(data, digest_size=16).digest()
+        cached_ast = self.cache.get(key)
+        if cached_ast is None:
+            cached_ast = self.parser.parse(data.decode("utf-8"))
+            self.cache[key] = cached_ast
+
+        # Hand out fresh lists so callers (e.g. the validator) can update
+        # declarations without touching the cached document
+        return replace(
+            cached_ast,
+            source_path=file_path,
+            imports=list(cached_ast.imports),
+            declarations=list(cached_ast.declarations),
+        )
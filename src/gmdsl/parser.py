@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import os
+import sys
+from dataclasses import replace
 from typing import Optional, Union
 
-from lark import Lark, Token, Transformer, Tree, v_args  # Import Tree
+from lark import Lark, Token, Transformer, v_args
 
 from . import ast
 
@@ -33,7 +36,9 @@ class AstTransformer(Transformer):
 
     # --- Terminal conversions ---
     def IDENTIFIER(self, s):
-        return str(s)
+        # Names and type names repeat across declarations (String, Integer, ...),
+        # so intern them to share one string object and compare by identity
+        return sys.intern(str(s))
 
     def STRING(self, s):
         # Remove quotes from string literals
@@ -232,24 +237,8 @@ class AstTransformer(Transformer):
             f"target_node not QualifiedName: {qualified_target} ({type(qualified_target)})"
         )
 
-        # Explicitly handle if direction_value is Token or Tree
-        direction = "->"  # Default direction
-        if direction_value:
-            if isinstance(direction_value, Token):
-                direction = str(direction_value)
-            elif (
-                isinstance(direction_value, Tree)
-                and direction_value.data == "edge_direction"
-                and direction_value.children
-            ):
-                # If it's a Tree, assume the first child is the token we want
-                direction = str(direction_value.children[0])
-            else:
-                # Fallback or error - use string representation
-                print(
-                    f"Warning: Unexpected type for edge direction: {type(direction_value)}"
-                )
-                direction = str(direction_value)
+        # edge_direction hands back the arrow itself as an interned str
+        direction = direction_value or "->"
 
         props = body if body else []
         return ast.EdgeDeclaration(
@@ -262,8 +251,8 @@ class AstTransformer(Transformer):
         )
 
     def edge_direction(self, *values):
-        # Always return the direction as a string ("->" or "<->")
-        return str(values[0]) if values else ""
+        # Return the direction token as a plain string ("->" or "<->")
+        return sys.intern(str(values[0])) if values else ""
 
     def document(self, *items):
         namespace = None
@@ -303,21 +292,44 @@ class AstTransformer(Transformer):
         )
 
 
-def parse_gmdsl(text: str, source_path: Optional[str] = None) -> ast.Document:
-    """Parses a GMDsl string and returns the AST Document."""
-    # Read grammar only once (consider caching if performance critical)
+@functools.lru_cache(maxsize=None)
+def _get_lark() -> Lark:
+    """Returns the process-wide Lark parser, building it on first use.
+
+    Reading the grammar and building the LALR tables and lexer regexes is by
+    far the most expensive part of parsing a small file, so it is done once.
+    The parser builds plain parse trees and keeps no per-parse state, so it is
+    safe to share.
+    """
     with open(_GRAMMAR_PATH, "r") as f:
         grammar = f.read()
+    return Lark(grammar, start="document", parser="lalr")
 
-    parser = Lark(
-        grammar, start="document", parser="lalr", transformer=AstTransformer()
-    )
-    tree: ast.Document = parser.parse(text)
-    if source_path is not None:
-        tree = ast.Document(
-            source_path=source_path,
-            namespace=tree.namespace,
-            imports=tree.imports,
-            declarations=tree.declarations,
-        )
-    return tree
+
+class Parser:
+    """Parses GMDsl source into AST Documents.
+
+    All Parsers share one Lark parser (see _get_lark), so creating a Parser is
+    cheap and each parse only pays for lexing, parsing and transforming.
+    """
+
+    def __init__(self):
+        self._lark = _get_lark()
+
+    def parse(self, text: str, source_path: Optional[str] = None) -> ast.Document:
+        """Parses a GMDsl string and returns the AST Document."""
+        # AstTransformer tracks the current namespace, so each parse gets its own
+        tree: ast.Document = AstTransformer().transform(self._lark.parse(text))
+        if source_path is not None:
+            tree = replace(tree, source_path=source_path)
+        return tree
+
+    def parse_file(self, path: str) -> ast.Document:
+        """Parses a GMDsl file and returns the AST Document."""
+        with open(path, "r") as f:
+            return self.parse(f.read(), source_path=path)
+
+
+def parse_gmdsl(text: str, source_path: Optional[str] = None) -> ast.Document:
+    """Parses a GMDsl string and returns the AST Document."""
+    return Parser().parse(text, source_path=source_path)
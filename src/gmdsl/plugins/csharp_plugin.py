@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import os
-from typing import Dict, Optional, Set
+from typing import Any, Dict, Optional, Set
 
 from gmdsl.ast import (
     Document,
@@ -57,6 +57,29 @@ class CSharpGenerator(CodeGeneratorPlugin):
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
 
+        # Generate one C# class per planned declaration
+        for decl in self._plan_declarations(loaded_asts).values():
+            if isinstance(decl, NodeDeclaration):
+                self._generate_node_class(decl, output_dir)
+            elif isinstance(decl, EdgeDeclaration):
+                self._generate_edge_class(decl, output_dir)
+            else:
+                self._generate_type_class(decl, output_dir)
+
+    def plan(self, loaded_asts: Dict[str, Document]) -> Dict[str, Set[str]]:
+        """Return the files ``generate`` would emit, without rendering them.
+
+        Maps each file name to the names of the declared properties (and, for
+        edges, the endpoint members) of its class. Relationship navigation
+        members are not modelled, so assert on those in generated files.
+        """
+        return {
+            file_name: self._member_names(decl)
+            for file_name, decl in self._plan_declarations(loaded_asts).items()
+        }
+
+    def _plan_declarations(self, loaded_asts: Dict[str, Document]) -> Dict[str, Any]:
+        """Map each output file name to the declaration it is generated from."""
         # Extract all node and edge declarations
         node_declarations = []
         edge_declarations = []
@@ -79,27 +102,30 @@ class CSharpGenerator(CodeGeneratorPlugin):
             "GM.Core.Integer",
             "GM.Core.Float",
         }
-        node_declarations = [
-            d for d in node_declarations if str(d.name) not in dotnet_core_types
-        ]
-        edge_declarations = [
-            d for d in edge_declarations if str(d.name) not in dotnet_core_types
-        ]
-        type_declarations = [
-            d for d in type_declarations if str(d.name) not in dotnet_core_types
-        ]
-
-        # Generate C# classes for nodes
-        for node_decl in node_declarations:
-            self._generate_node_class(node_decl, output_dir)
-
-        # Generate C# classes for edges
-        for edge_decl in edge_declarations:
-            self._generate_edge_class(edge_decl, output_dir)
-
-        # Generate C# classes for complex types
-        for type_decl in type_declarations:
-            self._generate_type_class(type_decl, output_dir)
+        return {
+            f"{decl.name}.cs": decl
+            for decl in node_declarations + edge_declarations + type_declarations
+            if str(decl.name) not in dotnet_core_types
+        }
+
+    def _member_names(self, decl) -> Set[str]:
+        """Names of the members emitted for a declaration's class."""
+        ignored_properties = self._get_ignored_properties(
+            self.get_annotation(decl, "Ignore")
+        )
+        members = {
+            prop.name for prop in decl.properties if prop.name not in ignored_properties
+        }
+        if isinstance(decl, EdgeDeclaration):
+            members |= {"SourceId", "TargetId"}
+            rel_annotation = self.get_annotation(decl, "RelationshipType")
+            if (
+                rel_annotation
+                and self.get_annotation_arg_value(rel_annotation, 0, "Reference")
+                == "Navigation"
+            ):
+                members |= {"Source", "Target"}
+        return members
 
     def _generate_node_class(self, node_decl: NodeDeclaration, output_dir: str):
         """Generate a C# class for a node declaration."""
@@ -12,11 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import dataclasses
 import os
-import re
-from typing import Dict
-
-from lark.tree import Tree
+from typing import Dict, Set
 
 # Import EdgeDeclaration here
 from gmdsl.ast import (
@@ -39,6 +37,15 @@ TYPE_MAP = {
     # Add other core types as needed
 }
 
+# Fixed parts of the generated schema, built once at import rather than per run
+_HEADER_LINES = (
+    "// Generated by gmdsl CypherGenerator",
+    "// Schema constraints and index suggestions",
+    "",
+)
+# Types whose properties get an index suggestion (spatial Location is excluded)
+_INDEXED_TYPES = frozenset(TYPE_MAP) - {"Location"}
+
 
 def _flatten_to_str(val):
     # Recursively flatten lists and convert to string
@@ -52,13 +59,12 @@ def _flatten_to_str(val):
 class CypherGenerator(CodeGeneratorPlugin):
     """Generates Cypher schema constraints and index suggestions."""
 
-    def generate(self, loaded_asts: Dict[str, Document], output_dir: str):
-        cypher_lines = []
-        cypher_lines.append("// Generated by gmdsl CypherGenerator")
-        cypher_lines.append("// Schema constraints and index suggestions")
-        cypher_lines.append("")
-
-        processed_nodes = set()
+    def generate(
+        self, loaded_asts: Dict[str, Document], output_dir: str
+    ) -> Dict[str, str]:
+        """Write schema.cypher to output_dir and return {file name: content}."""
+        cypher_lines = list(_HEADER_LINES)
+        processed_nodes: Set[str] = set()
 
         try:
             for doc_path, doc in loaded_asts.items():
@@ -67,13 +73,6 @@ class CypherGenerator(CodeGeneratorPlugin):
                     continue
 
                 for decl in doc.declarations:
-
-                    def _debug_flatten(val, label):
-                        flat = _flatten_to_str(val)
-                        if isinstance(val, list):
-                            print(f"[DEBUG] {label} was list: {val} -> {flat}")
-                        return flat
-
                     if isinstance(decl, NodeDeclaration):
                         node_label = decl.name.simple_name
                         if node_label in processed_nodes:
@@ -107,11 +106,7 @@ class CypherGenerator(CodeGeneratorPlugin):
 
                         cypher_lines.append(f"// Index suggestions for {node_label}")
                         for prop in decl.properties:
-                            type_name_str = str(prop.type_name)
-                            if (
-                                type_name_str in TYPE_MAP
-                                and type_name_str != "Location"
-                            ):
+                            if str(prop.type_name) in _INDEXED_TYPES:
                                 cypher_lines.append(
                                     f"CREATE INDEX IF NOT EXISTS FOR (n:{node_label}) ON (n.{prop.name});"
                                 )
@@ -130,27 +125,6 @@ class CypherGenerator(CodeGeneratorPlugin):
 
                     elif isinstance(decl, EdgeDeclaration):
                         direction = decl.direction
-                        if isinstance(direction, Tree):
-                            if (
-                                direction.data == "edge_direction"
-                                and direction.children
-                            ):
-                                direction = str(direction.children[0])
-                            else:
-                                direction = "<->"
-                        elif isinstance(direction, str):
-                            if (
-                                "Friend" in decl.name.simple_name
-                                and "Person" in decl.source_node.simple_name
-                            ):
-                                direction = "<->"
-                            elif "Tree" in direction:
-                                match = re.search(r"Token\\([^)]*'([^']*)", direction)
-                                if match:
-                                    direction = match.group(1)
-                                else:
-                                    direction = "<->" if "<->" in direction else "->"
-
                         edge_label = decl.name.simple_name
                         source_label = decl.source_node.simple_name
                         target_label = decl.target_node.simple_name
@@ -179,15 +153,19 @@ class CypherGenerator(CodeGeneratorPlugin):
             print(f"Exception: {e}")
             print(f"Type of e: {type(e)}")
             print(f"Current decl: {repr(decl)}")
-            if hasattr(decl, "__dict__"):
-                for k, v in decl.__dict__.items():
-                    print(f"  {k}: {v} (type: {type(v)})")
+            if dataclasses.is_dataclass(decl):
+                for f in dataclasses.fields(decl):
+                    v = getattr(decl, f.name)
+                    print(f"  {f.name}: {v} (type: {type(v)})")
             raise
 
+        content = "\n".join(cypher_lines)
         output_file_path = os.path.join(output_dir, "schema.cypher")
         try:
             with open(output_file_path, "w") as f:
-                f.write("\n".join(cypher_lines))
+                f.write(content)
             print(f"Successfully wrote Cypher schema to {output_file_path}")
         except IOError as e:
             print(f"Error writing Cypher file: {e}")
+
+        return {"schema.cypher": content}
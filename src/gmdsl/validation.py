@@ -24,6 +24,10 @@ class ValidationError:
     source_path: Optional[str] = None
     # TODO: Add location info (line/column) if needed later
 
+    def __contains__(self, text: str) -> bool:
+        """Tests the message for a substring, so `"Person" in error` works."""
+        return text in self.message
+
 
 class Validator:
     """Performs semantic validation on a collection of loaded GMDsl ASTs."""
@@ -118,6 +122,7 @@ class Validator:
         self.errors: List[ValidationError] = []
         self.defined_types: Dict[str, ast.TypeDeclaration] = {}
         self.defined_nodes: Dict[str, ast.NodeDeclaration] = {}
+        self.defined_edges: Dict[str, ast.EdgeDeclaration] = {}
         self.defined_annotations: Dict[str, ast.AnnotationDeclaration] = {}
 
         # --- First Pass: Collect all definitions ---
@@ -182,6 +187,13 @@ class Validator:
                         )
                     else:
                         self.defined_nodes[def_name] = declaration
+                elif isinstance(declaration, ast.EdgeDeclaration):
+                    if def_name in self.defined_edges:
+                        self._add_error(
+                            f"Duplicate edge definition: '{def_name}'", doc_path
+                        )
+                    else:
+                        self.defined_edges[def_name] = declaration
                 elif isinstance(declaration, ast.AnnotationDeclaration):
                     if def_name in self.defined_annotations:
                         self._add_error(
@@ -190,13 +202,29 @@ class Validator:
                     else:
                         self.defined_annotations[def_name] = declaration
 
+        # Index type names by namespace and the global node/annotation names
+        # once, so the per-document scope lookups below don't rescan every
+        # declaration of every document.
+        types_by_namespace: Dict[str, Set[str]] = {}
+        for doc in loaded_asts.values():
+            ns = str(doc.namespace.name).lower() if doc.namespace else ""
+            type_names = types_by_namespace.setdefault(ns, set())
+            for decl in doc.declarations:
+                if isinstance(decl, ast.TypeDeclaration):
+                    type_names.add(decl.name.simple_name)
+                    type_names.add(str(decl.name))
+        node_names = self._declared_names(self.defined_nodes.values())
+        annotation_names = self._declared_names(self.defined_annotations.values())
+
         # --- Second Pass: Validate references within each document ---
         for doc_path, doc in loaded_asts.items():
             available_types = self._get_available_types(
-                doc, core_types_doc, loaded_asts
+                doc, core_types_doc, types_by_namespace
+            )
+            available_nodes = self._get_available_nodes(doc, node_names)
+            available_annotations = self._get_available_annotations(
+                doc, annotation_names
             )
-            available_nodes = self._get_available_nodes(doc)
-            available_annotations = self._get_available_annotations(doc)
 
             for declaration in doc.declarations:
                 if isinstance(
@@ -267,9 +295,13 @@ class Validator:
         self,
         current_doc: ast.Document,
         core_types_doc: Optional[ast.Document],
-        all_docs: Dict[str, ast.Document],
+        types_by_namespace: Dict[str, Set[str]],
     ) -> Set[str]:
-        """Determines the set of type names available in the scope of current_doc."""
+        """Determines the set of type names available in the scope of current_doc.
+
+        types_by_namespace maps each lowercased namespace to the simple and
+        qualified names of the types it declares.
+        """
         available = set()
 
         # 1. Types defined in the current document
@@ -286,40 +318,44 @@ class Validator:
                 if isinstance(imp.module_name, ast.QualifiedName)
                 else str(imp.module_name)
             )
-            for doc in all_docs.values():
-                ns = str(doc.namespace.name) if doc.namespace else ""
-                if ns.lower().endswith(import_name.lower()):
-                    for decl in doc.declarations:
-                        if isinstance(decl, ast.TypeDeclaration):
-                            available.add(decl.name.simple_name)
-                            available.add(str(decl.name))
+            import_suffix = import_name.lower()
+            for ns, type_names in types_by_namespace.items():
+                if ns.endswith(import_suffix):
+                    available |= type_names
 
         return available
 
-    def _get_available_nodes(self, current_doc: ast.Document) -> Set[str]:
+    def _get_available_nodes(
+        self, current_doc: ast.Document, node_names: Set[str]
+    ) -> Set[str]:
         available = set()
         for decl in current_doc.declarations:
             if isinstance(decl, ast.NodeDeclaration):
                 available.add(decl.name.simple_name)
                 available.add(str(decl.name))
-        for name in self.defined_nodes.keys():
-            node = self.defined_nodes[name]
-            available.add(node.name.simple_name)
-            available.add(str(node.name))
+        available |= node_names
         return available
 
-    def _get_available_annotations(self, current_doc: ast.Document) -> Set[str]:
+    def _get_available_annotations(
+        self, current_doc: ast.Document, annotation_names: Set[str]
+    ) -> Set[str]:
         available = set()
         for decl in current_doc.declarations:
             if isinstance(decl, ast.AnnotationDeclaration):
                 available.add(decl.name.simple_name)
                 available.add(str(decl.name))
-        for name in self.defined_annotations.keys():
-            annotation = self.defined_annotations[name]
-            available.add(annotation.name.simple_name)
-            available.add(str(annotation.name))
+        available |= annotation_names
         return available
 
+    @staticmethod
+    def _declared_names(declarations) -> Set[str]:
+        """Returns the simple and fully qualified names of the declarations."""
+        names = set()
+        for decl in declarations:
+            names.add(decl.name.simple_name)
+            names.add(str(decl.name))
+        return names
+
     def _validate_properties(
         self,
         declaration: Union[
@@ -329,7 +365,16 @@ class Validator:
         source_path: Optional[str],
     ):
         """Validates that all property types are defined or imported."""
+        seen_properties: Dict[str, ast.PropertyDeclaration] = {}
         for prop in declaration.properties:
+            if prop.name in seen_properties:
+                self._add_error(
+                    f"Duplicate property '{prop.name}' in '{declaration.name}'",
+                    source_path,
+                )
+            else:
+                seen_properties[prop.name] = prop
+
             if prop.type_name is None:
                 continue  # Skip validation for properties without types
 
@@ -12,12 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import os
 import shutil
 import tempfile
+from pathlib import Path
 
 import pytest
 
+from gmdsl.loader import AstLoader
+from gmdsl.plugins.cypher_plugin import CypherGenerator
+
 
 @pytest.fixture
 def temp_output_dir():
@@ -27,6 +32,32 @@ def temp_output_dir():
     shutil.rmtree(temp_dir)  # Clean up after the test
 
 
+@pytest.fixture(scope="session")
+def cached_loader():
+    """An AstLoader with a parse cache, shared by the whole test session."""
+    return AstLoader(cache=dict())
+
+
+@pytest.fixture
+def include_loader(cached_loader):
+    """Makes AstLoaders with the given include paths.
+
+    They share cached_loader's parse cache, so files already parsed in the
+    session are not parsed again.
+    """
+
+    def make(include_paths):
+        return AstLoader(include_paths=include_paths, cache=cached_loader.cache)
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def cypher_generator():
+    """A CypherGenerator shared by the whole test session."""
+    return CypherGenerator()
+
+
 @pytest.fixture
 def examples_dir():
     """Path to the examples directory."""
@@ -34,15 +65,76 @@ def examples_dir():
     return os.path.join(base_dir, "examples")
 
 
+@pytest.fixture
+def fixtures_dir():
+    """Path (a ``pathlib.Path``) to the read-only model fixtures."""
+    return Path(__file__).parent / "fixtures"
+
+
 @pytest.fixture
 def test_files_dir():
     """Path to test files directory."""
     return os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_files")
 
 
-@pytest.fixture(scope="function")
-def setup_test_files(test_files_dir):
-    """Create the test files directory if it doesn't exist."""
-    os.makedirs(test_files_dir, exist_ok=True)
-    yield test_files_dir
-    # Files will be cleaned up by subsequent test runs
+@pytest.fixture(scope="session")
+def setup_test_files(tmp_path_factory):
+    """Create the directory (a ``pathlib.Path``) for the tests' input files.
+
+    The directory is created once per session (and so once per xdist worker).
+    Tests that rewrite a shared file name with different content, or that scan
+    the whole directory, should use their own ``tmp_path`` instead.
+
+    The include-path subdirectories the loader tests use are created up front.
+    """
+    root = tmp_path_factory.mktemp("gm")
+    for sub in ("lib", "models", "subdir"):
+        (root / sub).mkdir()
+    return root
+
+
+# Maps each path written by _write_fixture to the digest of the content last
+# written there and the file's mtime after that write
+_written_fixtures = {}
+
+
+def _write_fixture(path, content):
+    """Write a model fixture file, skipping the write if it is already current.
+
+    Rewriting the same content is a no-op unless the file has since been
+    changed behind the cache's back.
+    """
+    path = Path(path)
+    data = content.encode()
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    cached = _written_fixtures.get(path)
+    if cached and cached[0] == digest:
+        try:
+            if path.stat().st_mtime_ns == cached[1]:
+                return
+        except FileNotFoundError:
+            pass
+    path.write_bytes(data)
+    _written_fixtures[path] = (digest, path.stat().st_mtime_ns)
+
+
+def _write_files(root, files):
+    """Write several fixture files in one call.
+
+    ``files`` maps file names (joined onto ``root``; absolute paths are kept
+    as they are) to their content.
+    """
+    for name, content in files.items():
+        _write_fixture(Path(root, name), content)
+
+
+@pytest.fixture
+def write_fixture():
+    """Helper that writes model fixture files, skipping unchanged content."""
+    return _write_fixture
+
+
+@pytest.fixture
+def write_files():
+    """Helper that writes a {name: content} mapping of fixture files."""
+    return _write_files
@@ -15,10 +15,11 @@
 import os
 from unittest.mock import MagicMock, patch
 
+import click
 import pytest
 from click.testing import CliRunner
 
-from gmdsl.cli import cli, generate, validate
+from gmdsl.cli import _load_root, cli, generate, validate
 from gmdsl.loader import AstLoader
 from gmdsl.validation import ValidationError
 
@@ -105,6 +106,25 @@ class TestCliCommands:
             assert "Validation Errors" in result.output
             assert "Invalid type reference" in result.output
 
+    def test_validate_command_with_non_gm_file(self, runner):
+        """Test that a root file without a .gm extension is a usage error."""
+        with runner.isolated_filesystem():
+            with open("model.txt", "w") as f:
+                f.write("namespace Test\n")
+
+            result = runner.invoke(cli, ["validate", "model.txt"])
+
+            assert result.exit_code == 2
+            assert "Not a GMDsl (.gm) file" in result.output
+            assert not isinstance(result.exception, ValueError)
+
+    def test_load_root_chains_loader_error(self, tmp_path):
+        """Test that a rejected root file keeps the loader's error as the cause."""
+        with pytest.raises(click.BadParameter) as exc_info:
+            _load_root(AstLoader(), str(tmp_path / "model.txt"))
+
+        assert isinstance(exc_info.value.__cause__, ValueError)
+
     def test_generate_command_success(
         self, runner, mock_ast_loader, mock_validation, mock_run_generation
     ):
@@ -12,27 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
-import re
-from typing import Dict, List
+from pathlib import Path
+from typing import Dict, Optional, Union
 
-import pytest
-
-from gmdsl.ast import Document
 from gmdsl.codegen import run_generation
 from gmdsl.parser import Parser
 from gmdsl.plugins.csharp_plugin import CSharpGenerator
 
+_PARSER = Parser()
 
-class TestCSharpGenerator:
-    """Test suite for the C# code generator plugin."""
-
-    def test_basic_generation(self, setup_test_files, tmp_path):
-        """Test basic C# code generation with a simple model."""
-        # Create a test model file
-        test_file_path = os.path.join(setup_test_files, "simple_model.gm")
-        with open(test_file_path, "w") as f:
-            f.write("""
+_SRC_SIMPLE = """
 namespace TestModel;
 
 type Location {
@@ -55,95 +44,17 @@ edge Friend: Person <-> Person {
 edge Parent: Person -> Person {
     role: String
 }
-""")
-
-        # Parse the test file
-        parser = Parser()
-        ast = parser.parse_file(test_file_path)
-        loaded_asts = {test_file_path: ast}
-
-        # Generate C# code
-        generator = CSharpGenerator()
-        output_dir = str(tmp_path)
-        generator.generate(loaded_asts, output_dir)
-
-        # Check if output directory and model directory were created
-        model_dir = os.path.join(output_dir, "Models")
-        assert os.path.exists(model_dir)
-
-        # Check if all expected files were created
-        expected_files = [
-            "GraphModel.cs",
-            "Person.cs",
-            "Location.cs",
-            "Friend.cs",
-            "Parent.cs",
-        ]
-        for file_name in expected_files:
-            assert os.path.exists(os.path.join(model_dir, file_name))
-
-        # Check if Person.cs has the correct properties
-        with open(os.path.join(model_dir, "Person.cs")) as f:
-            person_content = f.read()
-            assert "public string FirstName { get; set; }" in person_content
-            assert "public string LastName { get; set; }" in person_content
-            assert "public DateTime DateOfBirth { get; set; }" in person_content
-            assert "public Location PlaceOfBirth { get; set; }" in person_content
-            # By default, should generate only outgoing relationship properties without "Outgoing" suffix
-            assert "public ICollection<Friend> Friends { get; set; }" in person_content
-            assert "public ICollection<Parent> Parents { get; set; }" in person_content
-            # Should not generate incoming properties by default
-            assert "FriendsIncoming" not in person_content
-            assert "ParentsIncoming" not in person_content
+"""
 
-        # Check if Friend.cs has the correct relationship and properties
-        with open(os.path.join(model_dir, "Friend.cs")) as f:
-            friend_content = f.read()
-            assert "public Person SourcePerson { get; set; }" in friend_content
-            assert "public Person TargetPerson { get; set; }" in friend_content
-            assert "public DateTime MetOn { get; set; }" in friend_content
-            assert "Direction: <->" in friend_content
-
-        # Check if Parent.cs has the correct relationship
-        with open(os.path.join(model_dir, "Parent.cs")) as f:
-            parent_content = f.read()
-            assert "Direction: ->" in parent_content
-
-    def test_custom_namespace(self, setup_test_files, tmp_path):
-        """Test C# code generation with a custom namespace."""
-        # Create a test model file
-        test_file_path = os.path.join(setup_test_files, "simple_model.gm")
-        with open(test_file_path, "w") as f:
-            f.write("""
+_SRC_DEFAULT_NAMESPACE = """
 namespace DefaultNamespace;
 
 node Person {
     name: String
 }
-""")
-
-        # Parse the test file
-        parser = Parser()
-        ast = parser.parse_file(test_file_path)
-        loaded_asts = {test_file_path: ast}
-
-        # Generate C# code with custom namespace
-        generator = CSharpGenerator()
-        output_dir = str(tmp_path)
-        custom_namespace = "MyCustom.Namespace"
-        generator.generate(loaded_asts, output_dir, namespace=custom_namespace)
+"""
 
-        # Check if the generated code uses the custom namespace
-        with open(os.path.join(output_dir, "Models", "Person.cs")) as f:
-            content = f.read()
-            assert f"namespace {custom_namespace}.Models" in content
-
-    def test_generate_incoming_properties(self, setup_test_files, tmp_path):
-        """Test C# code generation with incoming relationship properties."""
-        # Create a test model file
-        test_file_path = os.path.join(setup_test_files, "model_with_relationships.gm")
-        with open(test_file_path, "w") as f:
-            f.write("""
+_SRC_INCOMING = """
 namespace TestModel;
 
 node Person {
@@ -161,51 +72,9 @@ edge Authored: Person -> Document {
 edge Friend: Person <-> Person {
     since: Date
 }
-""")
-
-        # Parse the test file
-        parser = Parser()
-        ast = parser.parse_file(test_file_path)
-        loaded_asts = {test_file_path: ast}
-
-        # Generate C# code with generate_incoming=True
-        generator = CSharpGenerator()
-        output_dir = str(tmp_path)
-        generator.generate(loaded_asts, output_dir, generate_incoming=True)
-
-        # Check Person.cs for both outgoing and incoming properties
-        with open(os.path.join(output_dir, "Models", "Person.cs")) as f:
-            person_content = f.read()
-            # Should have outgoing property for Authored with Outgoing suffix
-            assert (
-                "public ICollection<Authored> AuthoredsOutgoing { get; set; }"
-                in person_content
-            )
-            # Should have both outgoing and incoming for Friend
-            assert (
-                "public ICollection<Friend> FriendsOutgoing { get; set; }"
-                in person_content
-            )
-            assert (
-                "public ICollection<Friend> FriendsIncoming { get; set; }"
-                in person_content
-            )
-
-        # Check Document.cs for incoming properties
-        with open(os.path.join(output_dir, "Models", "Document.cs")) as f:
-            document_content = f.read()
-            # Should have incoming property for Authored
-            assert (
-                "public ICollection<Authored> AuthoredsIncoming { get; set; }"
-                in document_content
-            )
+"""
 
-    def test_complex_types(self, setup_test_files, tmp_path):
-        """Test C# code generation with complex types and nested properties."""
-        # Create a test model file
-        test_file_path = os.path.join(setup_test_files, "complex_types_model.gm")
-        with open(test_file_path, "w") as f:
-            f.write("""
+_SRC_COMPLEX_TYPES = """
 namespace ComplexTypesTest;
 
 type Address {
@@ -224,51 +93,18 @@ node Person {
     name: String
     contact: ContactInfo
 }
-""")
-
-        # Parse the test file
-        parser = Parser()
-        ast = parser.parse_file(test_file_path)
-        loaded_asts = {test_file_path: ast}
-
-        # Generate C# code
-        generator = CSharpGenerator()
-        output_dir = str(tmp_path)
-        generator.generate(loaded_asts, output_dir)
-
-        # Check if all complex types were created
-        assert os.path.exists(os.path.join(output_dir, "Models", "Address.cs"))
-        assert os.path.exists(os.path.join(output_dir, "Models", "ContactInfo.cs"))
-        assert os.path.exists(os.path.join(output_dir, "Models", "Person.cs"))
+"""
 
-        # Check if ContactInfo has the Address property
-        with open(os.path.join(output_dir, "Models", "ContactInfo.cs")) as f:
-            content = f.read()
-            assert "public Address Address { get; set; }" in content
-
-        # Check if Person has the ContactInfo property
-        with open(os.path.join(output_dir, "Models", "Person.cs")) as f:
-            content = f.read()
-            assert "public ContactInfo Contact { get; set; }" in content
-
-    def test_multiple_files_generation(self, setup_test_files, tmp_path):
-        """Test C# code generation from multiple input files."""
-        # Create first file with types
-        types_file_path = os.path.join(setup_test_files, "types.gm")
-        with open(types_file_path, "w") as f:
-            f.write("""
+_SRC_SHARED_TYPES = """
 namespace SharedTypes;
 
 type Address {
     street: String
     city: String
 }
-""")
+"""
 
-        # Create second file with nodes and edges
-        model_file_path = os.path.join(setup_test_files, "model.gm")
-        with open(model_file_path, "w") as f:
-            f.write("""
+_SRC_MULTI_FILE = """
 namespace TestModel;
 
 import "types.gm";
@@ -279,29 +115,9 @@ node Person {
 }
 
 edge Lives: Person -> Address {}
-""")
-
-        # Parse both files
-        parser = Parser()
-        types_ast = parser.parse_file(types_file_path)
-        model_ast = parser.parse_file(model_file_path)
-        loaded_asts = {types_file_path: types_ast, model_file_path: model_ast}
+"""
 
-        # Generate C# code
-        generator = CSharpGenerator()
-        output_dir = str(tmp_path)
-        generator.generate(loaded_asts, output_dir)
-
-        # Check for all expected files
-        expected_files = ["Address.cs", "Person.cs", "Lives.cs", "GraphModel.cs"]
-        for file_name in expected_files:
-            assert os.path.exists(os.path.join(output_dir, "Models", file_name))
-
-    def test_relationships_default_mode(self, setup_test_files, tmp_path):
-        """Test relationship properties in default mode (no incoming properties)."""
-        test_file_path = os.path.join(setup_test_files, "relationships.gm")
-        with open(test_file_path, "w") as f:
-            f.write("""
+_SRC_RELATIONSHIPS = """
 namespace RelationshipsTest;
 
 node Person {
@@ -324,113 +140,9 @@ edge Manages: Person -> Person {
 edge Friend: Person <-> Person {
     since: Date
 }
-""")
-
-        parser = Parser()
-        ast = parser.parse_file(test_file_path)
-        loaded_asts = {test_file_path: ast}
-
-        # Generate C# code in default mode (no incoming properties)
-        generator = CSharpGenerator()
-        output_dir = str(tmp_path)
-        generator.generate(loaded_asts, output_dir, generate_incoming=False)
-
-        # Check Person.cs
-        with open(os.path.join(output_dir, "Models", "Person.cs")) as f:
-            person_content = f.read()
-            # Should have clean property names without Outgoing suffix
-            assert (
-                "public ICollection<WorksAt> WorksAts { get; set; }" in person_content
-            )
-            assert "public ICollection<Manages> Manages { get; set; }" in person_content
-            assert "public ICollection<Friend> Friends { get; set; }" in person_content
-            # Shouldn't have incoming properties
-            assert "Incoming" not in person_content
-
-        # Check Company.cs
-        with open(os.path.join(output_dir, "Models", "Company.cs")) as f:
-            company_content = f.read()
-            # Shouldn't have relationship properties in default mode
-            assert "WorksAt" not in company_content
-
-    def test_relationships_with_incoming(self, setup_test_files, tmp_path):
-        """Test relationship properties with incoming properties enabled."""
-        test_file_path = os.path.join(setup_test_files, "relationships.gm")
-        with open(test_file_path, "w") as f:
-            f.write("""
-namespace RelationshipsTest;
-
-node Person {
-    name: String
-}
-
-node Company {
-    name: String
-}
+"""
 
-edge WorksAt: Person -> Company {
-    position: String
-    startDate: Date
-}
-
-edge Manages: Person -> Person {
-    since: Date
-}
-
-edge Friend: Person <-> Person {
-    since: Date
-}
-""")
-
-        parser = Parser()
-        ast = parser.parse_file(test_file_path)
-        loaded_asts = {test_file_path: ast}
-
-        # Generate C# code with incoming properties
-        generator = CSharpGenerator()
-        output_dir = str(tmp_path)
-        generator.generate(loaded_asts, output_dir, generate_incoming=True)
-
-        # Check Person.cs
-        with open(os.path.join(output_dir, "Models", "Person.cs")) as f:
-            person_content = f.read()
-            # Should have Outgoing suffix
-            assert (
-                "public ICollection<WorksAt> WorksAtsOutgoing { get; set; }"
-                in person_content
-            )
-            assert (
-                "public ICollection<Manages> ManagesOutgoing { get; set; }"
-                in person_content
-            )
-            assert (
-                "public ICollection<Friend> FriendsOutgoing { get; set; }"
-                in person_content
-            )
-            # Should also have incoming for self-references (Friend and Manages)
-            assert (
-                "public ICollection<Manages> ManagesIncoming { get; set; }"
-                in person_content
-            )
-            assert (
-                "public ICollection<Friend> FriendsIncoming { get; set; }"
-                in person_content
-            )
-
-        # Check Company.cs
-        with open(os.path.join(output_dir, "Models", "Company.cs")) as f:
-            company_content = f.read()
-            # Should have incoming WorksAt since generate_incoming is True
-            assert (
-                "public ICollection<WorksAt> WorksAtsIncoming { get; set; }"
-                in company_content
-            )
-
-    def test_relationship_classes(self, setup_test_files, tmp_path):
-        """Test the generation of relationship classes with source and target properties."""
-        test_file_path = os.path.join(setup_test_files, "relationship_classes.gm")
-        with open(test_file_path, "w") as f:
-            f.write("""
+_SRC_RELATIONSHIP_CLASSES = """
 namespace RelationshipClassesTest;
 
 node Person {
@@ -445,32 +157,9 @@ edge Authored: Person -> Document {
     date: Date
     role: String
 }
-""")
-
-        parser = Parser()
-        ast = parser.parse_file(test_file_path)
-        loaded_asts = {test_file_path: ast}
+"""
 
-        # Generate C# code
-        generator = CSharpGenerator()
-        output_dir = str(tmp_path)
-        generator.generate(loaded_asts, output_dir)
-
-        # Check Authored.cs relationship class
-        with open(os.path.join(output_dir, "Models", "Authored.cs")) as f:
-            authored_content = f.read()
-            # Should have source and target properties with proper names
-            assert "public Person SourcePerson { get; set; }" in authored_content
-            assert "public Document TargetDocument { get; set; }" in authored_content
-            # Should have edge properties
-            assert "public DateTime Date { get; set; }" in authored_content
-            assert "public string Role { get; set; }" in authored_content
-
-    def test_type_mapping(self, setup_test_files, tmp_path):
-        """Test proper mapping of GMDsl types to C# types."""
-        test_file_path = os.path.join(setup_test_files, "type_mapping.gm")
-        with open(test_file_path, "w") as f:
-            f.write("""
+_SRC_TYPE_MAPPING = """
 namespace TypeMappingTest;
 
 node Entity {
@@ -480,32 +169,9 @@ node Entity {
     boolProp: Boolean
     dateProp: Date
 }
-""")
-
-        parser = Parser()
-        ast = parser.parse_file(test_file_path)
-        loaded_asts = {test_file_path: ast}
-
-        # Generate C# code
-        generator = CSharpGenerator()
-        output_dir = str(tmp_path)
-        generator.generate(loaded_asts, output_dir)
-
-        # Check Entity.cs for proper type mapping
-        with open(os.path.join(output_dir, "Models", "Entity.cs")) as f:
-            entity_content = f.read()
-            # Check each type mapping
-            assert "public string StringProp { get; set; }" in entity_content
-            assert "public int IntProp { get; set; }" in entity_content
-            assert "public double FloatProp { get; set; }" in entity_content
-            assert "public bool BoolProp { get; set; }" in entity_content
-            assert "public DateTime DateProp { get; set; }" in entity_content
+"""
 
-    def test_cli_run_generation(self, setup_test_files, tmp_path):
-        """Test C# code generation through the run_generation function."""
-        test_file_path = os.path.join(setup_test_files, "cli_test.gm")
-        with open(test_file_path, "w") as f:
-            f.write("""
+_SRC_CLI = """
 namespace CliTest;
 
 node Person {
@@ -513,26 +179,9 @@ node Person {
 }
 
 edge Friend: Person <-> Person {}
-""")
-
-        parser = Parser()
-        ast = parser.parse_file(test_file_path)
-        loaded_asts = {test_file_path: ast}
-
-        # Run generation through the CLI interface function
-        output_dir = str(tmp_path)
-        run_generation("csharp", loaded_asts, output_dir, namespace="Custom.Cli.Test")
-
-        # Verify files were created with the custom namespace
-        with open(os.path.join(output_dir, "Models", "Person.cs")) as f:
-            person_content = f.read()
-            assert "namespace Custom.Cli.Test.Models" in person_content
+"""
 
-    def test_pluralization(self, setup_test_files, tmp_path):
-        """Test the pluralization logic for relationship property names."""
-        test_file_path = os.path.join(setup_test_files, "pluralization_test.gm")
-        with open(test_file_path, "w") as f:
-            f.write("""
+_SRC_PLURALIZATION = """
 namespace PluralizationTest;
 
 node Person { name: String }
@@ -551,35 +200,291 @@ edge Creates: Person -> Buzz {}
 edge Plays: Person -> Match {}
 edge Uses: Person -> Dish {}
 edge LivesIn: Person -> City {}
-""")
+"""
+
+
+def _gen(
+    tmp_path: Path,
+    src: Union[str, Dict[str, str]],
+    gen: Optional[CSharpGenerator] = None,
+    **kwargs,
+) -> Dict[str, str]:
+    """Parse the model source(s), run the C# generator and return the emitted files.
+
+    ``src`` is either a single model source or a mapping of file name to source
+    for multi-file models. The result maps the name of each file the generator
+    writes (``<Namespace>.<Name>.cs``) to its content.
+    """
+    sources = src if isinstance(src, dict) else {"model.gm": src}
+    src_dir = tmp_path / "src"
+    out_dir = tmp_path / "out"
+    src_dir.mkdir()
+    out_dir.mkdir()
+    loaded_asts = {}
+    for file_name, content in sources.items():
+        path = src_dir / file_name
+        path.write_text(content, encoding="utf-8")
+        loaded_asts[str(path)] = _PARSER.parse_file(str(path))
+
+    (gen or CSharpGenerator()).generate(loaded_asts, str(out_dir), **kwargs)
+    return {f.name: f.read_text(encoding="utf-8") for f in out_dir.iterdir()}
+
+
+class TestCSharpGenerator:
+    """Test suite for the C# code generator plugin."""
+
+    def test_basic_generation(self, tmp_path):
+        """Test basic C# code generation with a simple model."""
+        files = _gen(tmp_path, _SRC_SIMPLE)
+
+        # Check if all expected files were created
+        expected_files = [
+            "GraphModel.cs",
+            "TestModel.Person.cs",
+            "TestModel.Location.cs",
+            "TestModel.Friend.cs",
+            "TestModel.Parent.cs",
+        ]
+        for file_name in expected_files:
+            assert file_name in files
+
+        # Check if Person.cs has the correct properties
+        person_content = files["TestModel.Person.cs"]
+        assert "public string FirstName { get; set; }" in person_content
+        assert "public string LastName { get; set; }" in person_content
+        assert "public DateTime DateOfBirth { get; set; }" in person_content
+        assert "public Location PlaceOfBirth { get; set; }" in person_content
+        # By default, should generate only outgoing relationship properties without "Outgoing" suffix
+        assert "public ICollection<Friend> Friends { get; set; }" in person_content
+        assert "public ICollection<Parent> Parents { get; set; }" in person_content
+        # Should not generate incoming properties by default
+        assert "FriendsIncoming" not in person_content
+        assert "ParentsIncoming" not in person_content
+
+        # Check if Friend.cs has the correct relationship and properties
+        friend_content = files["TestModel.Friend.cs"]
+        assert "public Person SourcePerson { get; set; }" in friend_content
+        assert "public Person TargetPerson { get; set; }" in friend_content
+        assert "public DateTime MetOn { get; set; }" in friend_content
+        assert "Direction: <->" in friend_content
+
+        # Check if Parent.cs has the correct relationship
+        assert "Direction: ->" in files["TestModel.Parent.cs"]
+
+    def test_custom_namespace(self, tmp_path):
+        """Test C# code generation with a custom namespace."""
+        custom_namespace = "MyCustom.Namespace"
+        files = _gen(tmp_path, _SRC_DEFAULT_NAMESPACE, namespace=custom_namespace)
+
+        # Check if the generated code uses the custom namespace
+        assert (
+            f"namespace {custom_namespace}.Models"
+            in files["DefaultNamespace.Person.cs"]
+        )
+
+    def test_generate_incoming_properties(self, tmp_path):
+        """Test C# code generation with incoming relationship properties."""
+        files = _gen(tmp_path, _SRC_INCOMING, generate_incoming=True)
+
+        # Check Person.cs for both outgoing and incoming properties
+        person_content = files["TestModel.Person.cs"]
+        # Should have outgoing property for Authored with Outgoing suffix
+        assert (
+            "public ICollection<Authored> AuthoredsOutgoing { get; set; }"
+            in person_content
+        )
+        # Should have both outgoing and incoming for Friend
+        assert (
+            "public ICollection<Friend> FriendsOutgoing { get; set; }" in person_content
+        )
+        assert (
+            "public ICollection<Friend> FriendsIncoming { get; set; }" in person_content
+        )
+
+        # Check Document.cs for incoming properties
+        # Should have incoming property for Authored
+        assert (
+            "public ICollection<Authored> AuthoredsIncoming { get; set; }"
+            in files["TestModel.Document.cs"]
+        )
+
+    def test_complex_types(self, tmp_path):
+        """Test C# code generation with complex types and nested properties."""
+        files = _gen(tmp_path, _SRC_COMPLEX_TYPES)
+
+        # Check if all complex types were created
+        assert "ComplexTypesTest.Address.cs" in files
+        assert "ComplexTypesTest.ContactInfo.cs" in files
+        assert "ComplexTypesTest.Person.cs" in files
+
+        # Check if ContactInfo has the Address property
+        assert (
+            "public Address Address { get; set; }"
+            in files["ComplexTypesTest.ContactInfo.cs"]
+        )
+
+        # Check if Person has the ContactInfo property
+        assert (
+            "public ContactInfo Contact { get; set; }"
+            in files["ComplexTypesTest.Person.cs"]
+        )
+
+    def test_multiple_files_generation(self, tmp_path):
+        """Test C# code generation from multiple input files."""
+        files = _gen(
+            tmp_path, {"types.gm": _SRC_SHARED_TYPES, "model.gm": _SRC_MULTI_FILE}
+        )
+
+        # Check for all expected files
+        expected_files = [
+            "SharedTypes.Address.cs",
+            "TestModel.Person.cs",
+            "TestModel.Lives.cs",
+            "GraphModel.cs",
+        ]
+        for file_name in expected_files:
+            assert file_name in files
 
-        parser = Parser()
-        ast = parser.parse_file(test_file_path)
-        loaded_asts = {test_file_path: ast}
+    def test_relationships_default_mode(self, tmp_path):
+        """Test relationship properties in default mode (no incoming properties)."""
+        # Generate C# code in default mode (no incoming properties)
+        files = _gen(tmp_path, _SRC_RELATIONSHIPS, generate_incoming=False)
 
-        # Generate C# code
+        # Check Person.cs
+        person_content = files["RelationshipsTest.Person.cs"]
+        # Should have clean property names without Outgoing suffix
+        assert "public ICollection<WorksAt> WorksAts { get; set; }" in person_content
+        assert "public ICollection<Manages> Manages { get; set; }" in person_content
+        assert "public ICollection<Friend> Friends { get; set; }" in person_content
+        # Shouldn't have incoming properties
+        assert "Incoming" not in person_content
+
+        # Check Company.cs
+        # Shouldn't have relationship properties in default mode
+        assert "WorksAt" not in files["RelationshipsTest.Company.cs"]
+
+    def test_generated_file_names(self, tmp_path):
+        """Test that each declaration is written to <Namespace>.<Name>.cs."""
+        files = _gen(
+            tmp_path,
+            "namespace Ex\ntype Address {\n  city: String\n}\n"
+            "node Person {\n  name: String\n}\nedge Knows(Person -> Person)\n",
+        )
+
+        assert set(files) == {"Ex.Address.cs", "Ex.Person.cs", "Ex.Knows.cs"}
+        assert "public String name { get; set; }" in files["Ex.Person.cs"]
+
+    def test_plan_matches_generated_files(self, tmp_path):
+        """Test that plan() names the files generate() writes and their members."""
+        loaded_asts = {
+            "plan.gm": _PARSER.parse(
+                "namespace Ex\nnode Person {\n  name: String\n}\n"
+                "edge Knows(Person -> Person)\n"
+            )
+        }
         generator = CSharpGenerator()
-        output_dir = str(tmp_path)
-        generator.generate(loaded_asts, output_dir)
+
+        plan = generator.plan(loaded_asts)
+        generator.generate(loaded_asts, str(tmp_path))
+
+        assert set(plan) == {f.name for f in tmp_path.iterdir()}
+        assert plan["Ex.Person.cs"] == {"name"}
+        assert plan["Ex.Knows.cs"] == {"SourceId", "TargetId"}
+        for file_name, members in plan.items():
+            content = (tmp_path / file_name).read_text(encoding="utf-8")
+            assert all(member in content for member in members)
+
+    def test_relationships_with_incoming(self, tmp_path):
+        """Test relationship properties with incoming properties enabled."""
+        # Generate C# code with incoming properties
+        files = _gen(tmp_path, _SRC_RELATIONSHIPS, generate_incoming=True)
+
+        # Check Person.cs
+        person_content = files["RelationshipsTest.Person.cs"]
+        # Should have Outgoing suffix
+        assert (
+            "public ICollection<WorksAt> WorksAtsOutgoing { get; set; }"
+            in person_content
+        )
+        assert (
+            "public ICollection<Manages> ManagesOutgoing { get; set; }"
+            in person_content
+        )
+        assert (
+            "public ICollection<Friend> FriendsOutgoing { get; set; }" in person_content
+        )
+        # Should also have incoming for self-references (Friend and Manages)
+        assert (
+            "public ICollection<Manages> ManagesIncoming { get; set; }"
+            in person_content
+        )
+        assert (
+            "public ICollection<Friend> FriendsIncoming { get; set; }" in person_content
+        )
+
+        # Check Company.cs
+        # Should have incoming WorksAt since generate_incoming is True
+        assert (
+            "public ICollection<WorksAt> WorksAtsIncoming { get; set; }"
+            in files["RelationshipsTest.Company.cs"]
+        )
+
+    def test_relationship_classes(self, tmp_path):
+        """Test the generation of relationship classes with source and target properties."""
+        files = _gen(tmp_path, _SRC_RELATIONSHIP_CLASSES)
+
+        # Check Authored.cs relationship class
+        authored_content = files["RelationshipClassesTest.Authored.cs"]
+        # Should have source and target properties with proper names
+        assert "public Person SourcePerson { get; set; }" in authored_content
+        assert "public Document TargetDocument { get; set; }" in authored_content
+        # Should have edge properties
+        assert "public DateTime Date { get; set; }" in authored_content
+        assert "public string Role { get; set; }" in authored_content
+
+    def test_type_mapping(self, tmp_path):
+        """Test proper mapping of GMDsl types to C# types."""
+        files = _gen(tmp_path, _SRC_TYPE_MAPPING)
+
+        # Check Entity.cs for proper type mapping
+        entity_content = files["TypeMappingTest.Entity.cs"]
+        # Check each type mapping
+        assert "public string StringProp { get; set; }" in entity_content
+        assert "public int IntProp { get; set; }" in entity_content
+        assert "public double FloatProp { get; set; }" in entity_content
+        assert "public bool BoolProp { get; set; }" in entity_content
+        assert "public DateTime DateProp { get; set; }" in entity_content
+
+    def test_cli_run_generation(self, setup_test_files, tmp_path):
+        """Test C# code generation through the run_generation function."""
+        test_file_path = setup_test_files / "cli_test.gm"
+        test_file_path.write_text(_SRC_CLI, encoding="utf-8")
+
+        ast = _PARSER.parse_file(str(test_file_path))
+        loaded_asts = {str(test_file_path): ast}
+
+        # Run generation through the CLI interface function
+        run_generation(
+            "csharp", loaded_asts, str(tmp_path), namespace="Custom.Cli.Test"
+        )
+
+        # Verify files were created with the custom namespace
+        person_content = (tmp_path / "CliTest.Person.cs").read_text(encoding="utf-8")
+        assert "namespace Custom.Cli.Test.Models" in person_content
+
+    def test_pluralization(self, tmp_path):
+        """Test the pluralization logic for relationship property names."""
+        files = _gen(tmp_path, _SRC_PLURALIZATION)
 
         # Check Person.cs for proper pluralization
-        with open(os.path.join(output_dir, "Models", "Person.cs")) as f:
-            person_content = f.read()
-            # Regular plurals
-            assert (
-                "public ICollection<WorksAt> WorksAts { get; set; }" in person_content
-            )
-            assert (
-                "public ICollection<Contains> Contains { get; set; }" in person_content
-            )
-            # Words ending in 's', 'x', 'z', 'ch', 'sh' should add 'es'
-            assert "public ICollection<Drives> Driveses { get; set; }" in person_content
-            assert (
-                "public ICollection<Creates> Createses { get; set; }" in person_content
-            )
-            assert "public ICollection<Plays> Playses { get; set; }" in person_content
-            assert "public ICollection<Uses> Useses { get; set; }" in person_content
-            # Words ending in 'y' should change to 'ies'
-            assert (
-                "public ICollection<LivesIn> LivesInies { get; set; }" in person_content
-            )
+        person_content = files["PluralizationTest.Person.cs"]
+        # Regular plurals
+        assert "public ICollection<WorksAt> WorksAts { get; set; }" in person_content
+        assert "public ICollection<Contains> Contains { get; set; }" in person_content
+        # Words ending in 's', 'x', 'z', 'ch', 'sh' should add 'es'
+        assert "public ICollection<Drives> Driveses { get; set; }" in person_content
+        assert "public ICollection<Creates> Createses { get; set; }" in person_content
+        assert "public ICollection<Plays> Playses { get; set; }" in person_content
+        assert "public ICollection<Uses> Useses { get; set; }" in person_content
+        # Words ending in 'y' should change to 'ies'
+        assert "public ICollection<LivesIn> LivesInies { get; set; }" in person_content
@@ -13,22 +13,74 @@
 # limitations under the License.
 
 import os
-import re
 
 import pytest
 
-from gmdsl.loader import AstLoader
-from gmdsl.plugins.cypher_plugin import CypherGenerator
 
-
-class TestCypherGenerator:
-    def test_basic_schema_generation(self, setup_test_files, temp_output_dir):
-        """Test basic Cypher schema generation for a simple model."""
-        test_file_path = os.path.join(setup_test_files, "simple_model.gm")
-
-        # Create a test file with a simple model
-        with open(test_file_path, "w") as f:
-            f.write("""
+def _has_sequence(s, *tokens):
+    """Whether the tokens all occur in s, in order and without overlapping."""
+    i = 0
+    for token in tokens:
+        i = s.find(token, i)
+        if i == -1:
+            return False
+        i += len(token)
+    return True
+
+
+def _has_before(s, first, second):
+    """Whether second occurs somewhere after first in s."""
+    return _has_sequence(s, first, second)
+
+
+_DEL_WHITESPACE = str.maketrans("", "", " \n\t")
+
+
+_BASIC_TOKENS = (
+    "CREATE CONSTRAINT",
+    "FOR (n:Person)",
+    "REQUIRE n.id IS UNIQUE",
+    "CREATE INDEX",
+    "firstName",
+    "lastName",
+    "age",
+    "WITH rel",
+    "MATCH ()-[rel:FRIEND]->()",
+    "since",
+)
+
+_COMPLEX_TOKENS = (
+    "CREATE INDEX",
+    "email",
+    "price",
+    "orderNumber",
+    "address",
+    "MATCH ()-[rel:ORDERS]->()",
+    "MATCH ()-[rel:CONTAINS]->()",
+    "MATCH ()-[rel:REVIEWS]->()",
+    "deliveryAddress",
+    "quantity",
+    "rating",
+)
+
+_DATA_TYPE_NAMES = (
+    "String",
+    "string",
+    "Integer",
+    "integer",
+    "int",
+    "Float",
+    "float",
+    "double",
+    "Boolean",
+    "boolean",
+    "bool",
+    "Date",
+    "date",
+    "datetime",
+)
+
+_SRC_SIMPLE = """
 namespace TestModel;
 
 node Person {
@@ -40,45 +92,9 @@ node Person {
 edge Friend: Person <-> Person {
     since: Date
 }
-""")
+"""
 
-        # Load the AST
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
-
-        # Generate Cypher schema
-        generator = CypherGenerator()
-        generator.generate(loaded_asts, temp_output_dir)
-
-        # Check that schema file was generated
-        schema_file = os.path.join(temp_output_dir, "schema.cypher")
-        assert os.path.exists(schema_file)
-
-        # Read the generated schema
-        with open(schema_file, "r") as f:
-            schema_content = f.read()
-
-        # Verify node constraints and properties
-        assert "CREATE CONSTRAINT" in schema_content
-        assert "FOR (n:Person)" in schema_content
-        assert "REQUIRE n.id IS UNIQUE" in schema_content
-        assert "CREATE INDEX" in schema_content
-        assert "firstName" in schema_content
-        assert "lastName" in schema_content
-        assert "age" in schema_content
-
-        # Verify relationship properties
-        assert "WITH rel" in schema_content
-        assert "MATCH ()-[rel:FRIEND]->()" in schema_content
-        assert "since" in schema_content
-
-    def test_complex_schema_generation(self, setup_test_files, temp_output_dir):
-        """Test Cypher schema generation with complex types and multiple relationships."""
-        test_file_path = os.path.join(setup_test_files, "complex_schema.gm")
-
-        # Create a test file with complex types and multiple relationships
-        with open(test_file_path, "w") as f:
-            f.write("""
+_SRC_COMPLEX = """
 namespace ComplexSchema;
 
 type Address {
@@ -119,67 +135,9 @@ edge Reviews: Customer -> Product {
     text: String
     date: Date
 }
-""")
-
-        # Load the AST
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
+"""
 
-        # Generate Cypher schema
-        generator = CypherGenerator()
-        generator.generate(loaded_asts, temp_output_dir)
-
-        # Check that schema file was generated
-        schema_file = os.path.join(temp_output_dir, "schema.cypher")
-        assert os.path.exists(schema_file)
-
-        # Read the generated schema
-        with open(schema_file, "r") as f:
-            schema_content = f.read()
-
-        # Verify node constraints
-        assert (
-            re.search(
-                r"CREATE CONSTRAINT.+FOR \(n:Customer\)", schema_content, re.DOTALL
-            )
-            is not None
-        )
-        assert (
-            re.search(
-                r"CREATE CONSTRAINT.+FOR \(n:Product\)", schema_content, re.DOTALL
-            )
-            is not None
-        )
-        assert (
-            re.search(r"CREATE CONSTRAINT.+FOR \(n:Order\)", schema_content, re.DOTALL)
-            is not None
-        )
-
-        # Verify property indices
-        assert "CREATE INDEX" in schema_content
-        assert "email" in schema_content
-        assert "price" in schema_content
-        assert "orderNumber" in schema_content
-
-        # Verify complex type properties
-        assert "address" in schema_content
-
-        # Verify relationship declarations
-        assert "MATCH ()-[rel:ORDERS]->()" in schema_content
-        assert "MATCH ()-[rel:CONTAINS]->()" in schema_content
-        assert "MATCH ()-[rel:REVIEWS]->()" in schema_content
-
-        # Verify relationship properties
-        assert "deliveryAddress" in schema_content
-        assert "quantity" in schema_content
-        assert "rating" in schema_content
-
-    def test_schema_with_imports(self, setup_test_files, temp_output_dir):
-        """Test Cypher generation with model files that have imports."""
-        # Create base types file
-        base_types_path = os.path.join(setup_test_files, "BaseTypes.gm")
-        with open(base_types_path, "w") as f:
-            f.write("""
+_SRC_BASE_TYPES = """
 namespace BaseTypes;
 
 type Address {
@@ -194,76 +152,30 @@ type ContactInfo {
     phone: String
     address: Address
 }
-""")
+"""
 
-        # Create main model file with import
-        main_model_path = os.path.join(setup_test_files, "MainModel.gm")
-        with open(main_model_path, "w") as f:
-            f.write(f"""
+_SRC_MAIN = """
 namespace MainModel;
 
-import "{os.path.basename(base_types_path)}";
+import "BaseTypes.gm";
 
-node Person {{
+node Person {
     name: String
     contact: BaseTypes.ContactInfo
-}}
+}
 
-node Company {{
+node Company {
     name: String
     founded: Date
     address: BaseTypes.Address
-}}
+}
 
-edge WorksAt: Person -> Company {{
+edge WorksAt: Person -> Company {
     position: String
     startDate: Date
-}}
-""")
-
-        # Load the AST with import resolution
-        loader = AstLoader(include_paths=[setup_test_files])
-        loaded_asts = loader.load(main_model_path)
-
-        # Generate Cypher schema
-        generator = CypherGenerator()
-        generator.generate(loaded_asts, temp_output_dir)
-
-        # Check that schema file was generated
-        schema_file = os.path.join(temp_output_dir, "schema.cypher")
-        assert os.path.exists(schema_file)
-
-        # Read the generated schema
-        with open(schema_file, "r") as f:
-            schema_content = f.read()
-
-        # Verify node constraints for both Person and Company
-        assert (
-            re.search(r"CREATE CONSTRAINT.+FOR \(n:Person\)", schema_content, re.DOTALL)
-            is not None
-        )
-        assert (
-            re.search(
-                r"CREATE CONSTRAINT.+FOR \(n:Company\)", schema_content, re.DOTALL
-            )
-            is not None
-        )
-
-        # Verify complex type properties are correctly included
-        assert "contact" in schema_content
-        assert "address" in schema_content
-
-        # Verify relationship and its properties
-        assert "MATCH ()-[rel:WORKS_AT]->()" in schema_content
-        assert "position" in schema_content
-        assert "startDate" in schema_content
-
-    def test_relationship_directionality(self, setup_test_files, temp_output_dir):
-        """Test Cypher schema generation for different relationship directions."""
-        test_file_path = os.path.join(setup_test_files, "relationship_directions.gm")
-
-        with open(test_file_path, "w") as f:
-            f.write("""
+}
+"""
+_SRC_DIRECTIONS = """
 namespace DirectionTest;
 
 node Person {
@@ -300,52 +212,9 @@ edge Comments: Person -> Post {
     text: String
     date: Date
 }
-""")
-
-        # Load and generate Cypher
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
-        generator = CypherGenerator()
-        generator.generate(loaded_asts, temp_output_dir)
+"""
 
-        schema_file = os.path.join(temp_output_dir, "schema.cypher")
-        with open(schema_file, "r") as f:
-            schema_content = f.read()
-
-        # Check directionality in comments
-        assert "// Direction: ->" in schema_content
-        assert "// Direction: <->" in schema_content
-
-        # Check relationship constraints
-        assert "MATCH ()-[rel:WORKS_AT]->()" in schema_content
-        assert (
-            "MATCH ()-[rel:FRIEND]-()" in schema_content
-        )  # Bidirectional should not have arrow
-        assert "MATCH ()-[rel:MANAGES]->()" in schema_content
-
-        # Check for multiple edge types
-        assert "MATCH ()-[rel:LIKES]->()" in schema_content
-        assert "MATCH ()-[rel:COMMENTS]->()" in schema_content
-
-        # Verify properties
-        assert "position: String" in schema_content.replace(" ", "").replace(
-            "\n", ""
-        ) or "position:string" in schema_content.lower().replace(" ", "").replace(
-            "\n", ""
-        )
-        assert "since: Date" in schema_content.replace(" ", "").replace(
-            "\n", ""
-        ) or "since:date" in schema_content.lower().replace(" ", "").replace("\n", "")
-        assert "text: String" in schema_content.replace(" ", "").replace(
-            "\n", ""
-        ) or "text:string" in schema_content.lower().replace(" ", "").replace("\n", "")
-
-    def test_cypher_naming_conventions(self, setup_test_files, temp_output_dir):
-        """Test that Cypher generator follows Neo4j naming conventions."""
-        test_file_path = os.path.join(setup_test_files, "naming_conventions.gm")
-
-        with open(test_file_path, "w") as f:
-            f.write("""
+_SRC_NAMING = """
 namespace NamingTest;
 
 node UserAccount {
@@ -372,41 +241,9 @@ edge ConnectedTo: UserAccount <-> UserAccount {
     connectionDate: Date
     connectionType: String
 }
-""")
-
-        # Load and generate Cypher
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
-        generator = CypherGenerator()
-        generator.generate(loaded_asts, temp_output_dir)
-
-        schema_file = os.path.join(temp_output_dir, "schema.cypher")
-        with open(schema_file, "r") as f:
-            schema_content = f.read()
-
-        # Check Node labels follow CamelCase convention
-        assert "UserAccount" in schema_content
-        assert "BlogPost" in schema_content
-
-        # Check relationship types follow UPPERCASE_WITH_UNDERSCORES convention
-        assert "AUTHORED_BY" in schema_content
-        assert "REACTED_TO" in schema_content
-        assert "CONNECTED_TO" in schema_content
-
-        # Check property names follow camelCase convention
-        assert "firstName" in schema_content
-        assert "lastName" in schema_content
-        assert "emailAddress" in schema_content
-        assert "postTitle" in schema_content
-        assert "publishedDate" in schema_content
-        assert "connectionType" in schema_content
-
-    def test_cypher_data_types(self, setup_test_files, temp_output_dir):
-        """Test Cypher generator maps data types correctly."""
-        test_file_path = os.path.join(setup_test_files, "data_types.gm")
+"""
 
-        with open(test_file_path, "w") as f:
-            f.write("""
+_SRC_DATA_TYPES = """
 namespace DataTypeTest;
 
 node Entity {
@@ -424,51 +261,9 @@ edge Relationship: Entity -> Entity {
     booleanProperty: Boolean
     dateProperty: Date
 }
-""")
+"""
 
-        # Load and generate Cypher
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
-        generator = CypherGenerator()
-        generator.generate(loaded_asts, temp_output_dir)
-
-        schema_file = os.path.join(temp_output_dir, "schema.cypher")
-        with open(schema_file, "r") as f:
-            schema_content = f.read()
-
-        # Check for all data types in comments or property declarations
-        expected_types = [
-            "String",
-            "string",
-            "Integer",
-            "integer",
-            "int",
-            "Float",
-            "float",
-            "double",
-            "Boolean",
-            "boolean",
-            "bool",
-            "Date",
-            "date",
-            "datetime",
-        ]
-
-        # At least some of these types should be present in the schema
-        found_types = 0
-        for type_name in expected_types:
-            if type_name in schema_content:
-                found_types += 1
-
-        # Should match at least one variant of each type (5 types)
-        assert found_types >= 5, "Not all expected data types were found in the schema"
-
-    def test_complex_nested_types(self, setup_test_files, temp_output_dir):
-        """Test Cypher generation with nested complex types."""
-        test_file_path = os.path.join(setup_test_files, "nested_types.gm")
-
-        with open(test_file_path, "w") as f:
-            f.write("""
+_SRC_NESTED_TYPES = """
 namespace NestedTypesTest;
 
 type GeoPoint {
@@ -502,43 +297,9 @@ edge LivesNear: Person -> Person {
     distance: Float
     location: GeoPoint
 }
-""")
-
-        # Load and generate Cypher
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
-        generator = CypherGenerator()
-        generator.generate(loaded_asts, temp_output_dir)
-
-        schema_file = os.path.join(temp_output_dir, "schema.cypher")
-        with open(schema_file, "r") as f:
-            schema_content = f.read()
-
-        # Verify node with nested properties
-        assert "Person" in schema_content
-        assert "contact" in schema_content
+"""
 
-        # Check cypher representation of nested properties
-        # The exact format may vary based on implementation, but all properties
-        # should be flattened or serialized in some way
-
-        # For nodes, check property handling
-        assert re.search(r"contact", schema_content, re.IGNORECASE) is not None
-        assert re.search(r"workAddress", schema_content, re.IGNORECASE) is not None
-
-        # For relationships, check property handling
-        assert re.search(r"LIVES_NEAR", schema_content) is not None
-        assert re.search(r"distance", schema_content, re.IGNORECASE) is not None
-        assert re.search(r"location", schema_content, re.IGNORECASE) is not None
-
-    def test_specialized_constraints_and_indices(
-        self, setup_test_files, temp_output_dir
-    ):
-        """Test generation of specialized constraints and indices."""
-        test_file_path = os.path.join(setup_test_files, "constraints_indices.gm")
-
-        with open(test_file_path, "w") as f:
-            f.write("""
+_SRC_CONSTRAINTS = """
 namespace ConstraintsTest;
 
 node User {
@@ -562,85 +323,327 @@ edge Purchased: User -> Product {
     quantity: Integer
     totalPrice: Float     // Searchable
 }
-""")
+"""
 
-        # Load and generate Cypher
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
-        generator = CypherGenerator()
-        generator.generate(loaded_asts, temp_output_dir)
+_SRC_HEADER = """
+namespace HeaderTest;
 
-        schema_file = os.path.join(temp_output_dir, "schema.cypher")
-        with open(schema_file, "r") as f:
-            schema_content = f.read()
+node Test {
+    name: String
+}
+"""
 
-        # Check for node uniqueness constraints
-        assert (
-            re.search(
-                r"CREATE CONSTRAINT.+User.+id.+UNIQUE",
-                schema_content,
-                re.DOTALL | re.IGNORECASE,
-            )
-            is not None
+
+class TestCypherGenerator:
+    def test_basic_schema_generation(
+        self,
+        setup_test_files,
+        temp_output_dir,
+        cached_loader,
+        cypher_generator,
+        write_fixture,
+    ):
+        """Test basic Cypher schema generation for a simple model."""
+        test_file_path = setup_test_files / "simple_model.gm"
+
+        # Create a test file with a simple model
+        write_fixture(test_file_path, _SRC_SIMPLE)
+
+        # Load the AST
+        loaded_asts = cached_loader.load(test_file_path)
+
+        # Generate Cypher schema
+        schema_content = cypher_generator.generate(loaded_asts, temp_output_dir)[
+            "schema.cypher"
+        ]
+
+        # Check that schema file was generated
+        assert os.path.exists(os.path.join(temp_output_dir, "schema.cypher"))
+
+        # Verify node constraints, properties and relationship properties
+        assert all(t in schema_content for t in _BASIC_TOKENS)
+
+    def test_complex_schema_generation(
+        self,
+        setup_test_files,
+        temp_output_dir,
+        cached_loader,
+        cypher_generator,
+        write_fixture,
+    ):
+        """Test Cypher schema generation with complex types and multiple relationships."""
+        test_file_path = setup_test_files / "complex_schema.gm"
+
+        # Create a test file with complex types and multiple relationships
+        write_fixture(test_file_path, _SRC_COMPLEX)
+
+        # Load the AST
+        loaded_asts = cached_loader.load(test_file_path)
+
+        # Generate Cypher schema
+        schema_content = cypher_generator.generate(loaded_asts, temp_output_dir)[
+            "schema.cypher"
+        ]
+
+        # Check that schema file was generated
+        assert os.path.exists(os.path.join(temp_output_dir, "schema.cypher"))
+
+        # Verify node constraints
+        assert _has_before(schema_content, "CREATE CONSTRAINT", "FOR (n:Customer)")
+        assert _has_before(schema_content, "CREATE CONSTRAINT", "FOR (n:Product)")
+        assert _has_before(schema_content, "CREATE CONSTRAINT", "FOR (n:Order)")
+
+        # Verify property indices, complex type properties and relationships
+        assert all(t in schema_content for t in _COMPLEX_TOKENS)
+
+    def test_schema_with_imports(
+        self,
+        setup_test_files,
+        temp_output_dir,
+        include_loader,
+        cypher_generator,
+        write_files,
+    ):
+        """Test Cypher generation with model files that have imports."""
+        # Create the base types file and the main model file that imports it
+        write_files(
+            setup_test_files,
+            {"BaseTypes.gm": _SRC_BASE_TYPES, "MainModel.gm": _SRC_MAIN},
         )
+        main_model_path = setup_test_files / "MainModel.gm"
+
+        # Load the AST with import resolution
+        loaded_asts = include_loader([str(setup_test_files)]).load(main_model_path)
+
+        # Generate Cypher schema
+        schema_content = cypher_generator.generate(loaded_asts, temp_output_dir)[
+            "schema.cypher"
+        ]
+
+        # Check that schema file was generated
+        assert os.path.exists(os.path.join(temp_output_dir, "schema.cypher"))
+
+        # Verify node constraints for both Person and Company
+        assert _has_before(schema_content, "CREATE CONSTRAINT", "FOR (n:Person)")
+        assert _has_before(schema_content, "CREATE CONSTRAINT", "FOR (n:Company)")
+
+        # Verify complex type properties are correctly included
+        assert "contact" in schema_content
+        assert "address" in schema_content
+
+        # Verify relationship and its properties
+        assert "MATCH ()-[rel:WORKS_AT]->()" in schema_content
+        assert "position" in schema_content
+        assert "startDate" in schema_content
+
+    def test_relationship_directionality(
+        self,
+        setup_test_files,
+        temp_output_dir,
+        cached_loader,
+        cypher_generator,
+        write_fixture,
+    ):
+        """Test Cypher schema generation for different relationship directions."""
+        test_file_path = setup_test_files / "relationship_directions.gm"
+
+        write_fixture(test_file_path, _SRC_DIRECTIONS)
+
+        # Load and generate Cypher
+        loaded_asts = cached_loader.load(test_file_path)
+        schema_content = cypher_generator.generate(loaded_asts, temp_output_dir)[
+            "schema.cypher"
+        ]
+
+        # Check directionality in comments
+        assert "// Direction: ->" in schema_content
+        assert "// Direction: <->" in schema_content
+
+        # Check relationship constraints
+        assert "MATCH ()-[rel:WORKS_AT]->()" in schema_content
         assert (
-            re.search(
-                r"CREATE CONSTRAINT.+Product.+id.+UNIQUE",
-                schema_content,
-                re.DOTALL | re.IGNORECASE,
-            )
-            is not None
+            "MATCH ()-[rel:FRIEND]-()" in schema_content
+        )  # Bidirectional should not have arrow
+        assert "MATCH ()-[rel:MANAGES]->()" in schema_content
+
+        # Check for multiple edge types
+        assert "MATCH ()-[rel:LIKES]->()" in schema_content
+        assert "MATCH ()-[rel:COMMENTS]->()" in schema_content
+
+        # Verify properties, ignoring whitespace
+        compact = schema_content.translate(_DEL_WHITESPACE)
+        compact_lower = compact.lower()
+        assert "position:String" in compact or "position:string" in compact_lower
+        assert "since:Date" in compact or "since:date" in compact_lower
+        assert "text:String" in compact or "text:string" in compact_lower
+
+    def test_edge_direction_in_schema(
+        self, tmp_path, cached_loader, cypher_generator, write_fixture
+    ):
+        """Test that the schema describes each edge with its declared direction."""
+        model_path = tmp_path / "directions.gm"
+        write_fixture(
+            model_path,
+            "namespace Ex\nnode A {\n}\nnode B {\n}\n"
+            "edge E(A <-> B)\nedge F(A -> B)\n",
         )
 
+        loaded_asts = cached_loader.load(model_path)
+        schema_content = cypher_generator.generate(loaded_asts, str(tmp_path))[
+            "schema.cypher"
+        ]
+
+        assert ":E connects (A) <-> (B)" in schema_content
+        assert ":F connects (A) -> (B)" in schema_content
+
+    def test_cypher_naming_conventions(
+        self,
+        setup_test_files,
+        temp_output_dir,
+        cached_loader,
+        cypher_generator,
+        write_fixture,
+    ):
+        """Test that Cypher generator follows Neo4j naming conventions."""
+        test_file_path = setup_test_files / "naming_conventions.gm"
+
+        write_fixture(test_file_path, _SRC_NAMING)
+
+        # Load and generate Cypher
+        loaded_asts = cached_loader.load(test_file_path)
+        schema_content = cypher_generator.generate(loaded_asts, temp_output_dir)[
+            "schema.cypher"
+        ]
+
+        # Check Node labels follow CamelCase convention
+        assert "UserAccount" in schema_content
+        assert "BlogPost" in schema_content
+
+        # Check relationship types follow UPPERCASE_WITH_UNDERSCORES convention
+        assert "AUTHORED_BY" in schema_content
+        assert "REACTED_TO" in schema_content
+        assert "CONNECTED_TO" in schema_content
+
+        # Check property names follow camelCase convention
+        assert "firstName" in schema_content
+        assert "lastName" in schema_content
+        assert "emailAddress" in schema_content
+        assert "postTitle" in schema_content
+        assert "publishedDate" in schema_content
+        assert "connectionType" in schema_content
+
+    def test_cypher_data_types(
+        self,
+        setup_test_files,
+        temp_output_dir,
+        cached_loader,
+        cypher_generator,
+        write_fixture,
+    ):
+        """Test Cypher generator maps data types correctly."""
+        test_file_path = setup_test_files / "data_types.gm"
+
+        write_fixture(test_file_path, _SRC_DATA_TYPES)
+
+        # Load and generate Cypher
+        loaded_asts = cached_loader.load(test_file_path)
+        schema_content = cypher_generator.generate(loaded_asts, temp_output_dir)[
+            "schema.cypher"
+        ]
+
+        # Check for all data types in comments or property declarations
+        found_types = sum(t in schema_content for t in _DATA_TYPE_NAMES)
+
+        # Should match at least one variant of each type (5 types)
+        assert found_types >= 5, "Not all expected data types were found in the schema"
+
+    def test_complex_nested_types(
+        self,
+        setup_test_files,
+        temp_output_dir,
+        cached_loader,
+        cypher_generator,
+        write_fixture,
+    ):
+        """Test Cypher generation with nested complex types."""
+        test_file_path = setup_test_files / "nested_types.gm"
+
+        write_fixture(test_file_path, _SRC_NESTED_TYPES)
+
+        # Load and generate Cypher
+        loaded_asts = cached_loader.load(test_file_path)
+        schema_content = cypher_generator.generate(loaded_asts, temp_output_dir)[
+            "schema.cypher"
+        ]
+
+        # Verify node with nested properties
+        assert "Person" in schema_content
+        assert "contact" in schema_content
+
+        # Check cypher representation of nested properties
+        # The exact format may vary based on implementation, but all properties
+        # should be flattened or serialized in some way
+
+        # For nodes, check property handling (plain substring checks, no regex)
+        lowered = schema_content.lower()
+        assert "contact" in lowered
+        assert "workaddress" in lowered
+
+        # For relationships, check property handling
+        assert "LIVES_NEAR" in schema_content
+        assert "distance" in lowered
+        assert "location" in lowered
+
+    def test_specialized_constraints_and_indices(
+        self,
+        setup_test_files,
+        temp_output_dir,
+        cached_loader,
+        cypher_generator,
+        write_fixture,
+    ):
+        """Test generation of specialized constraints and indices."""
+        test_file_path = setup_test_files / "constraints_indices.gm"
+
+        write_fixture(test_file_path, _SRC_CONSTRAINTS)
+
+        # Load and generate Cypher
+        loaded_asts = cached_loader.load(test_file_path)
+        schema_content = cypher_generator.generate(loaded_asts, temp_output_dir)[
+            "schema.cypher"
+        ]
+
+        # Check for node uniqueness constraints (case-insensitive)
+        lowered = schema_content.lower()
+        assert _has_sequence(lowered, "create constraint", "user", "id", "unique")
+        assert _has_sequence(lowered, "create constraint", "product", "id", "unique")
+
         # Check for indices on searchable properties
-        assert (
-            re.search(
-                r"CREATE INDEX.+User.+age", schema_content, re.DOTALL | re.IGNORECASE
-            )
-            is not None
-        )
-        assert (
-            re.search(
-                r"CREATE INDEX.+Product.+name",
-                schema_content,
-                re.DOTALL | re.IGNORECASE,
-            )
-            is not None
-        )
-        assert (
-            re.search(
-                r"CREATE INDEX.+Product.+price",
-                schema_content,
-                re.DOTALL | re.IGNORECASE,
-            )
-            is not None
-        )
+        assert _has_sequence(lowered, "create index", "user", "age")
+        assert _has_sequence(lowered, "create index", "product", "name")
+        assert _has_sequence(lowered, "create index", "product", "price")
 
         # Check for relationship structure
         assert "MATCH ()-[rel:PURCHASED]->()" in schema_content
 
-    def test_cypher_schema_header_comments(self, setup_test_files, temp_output_dir):
+    def test_cypher_schema_header_comments(
+        self,
+        setup_test_files,
+        temp_output_dir,
+        cached_loader,
+        cypher_generator,
+        write_fixture,
+    ):
         """Test that the Cypher schema has proper header comments."""
-        test_file_path = os.path.join(setup_test_files, "simple_for_header.gm")
+        test_file_path = setup_test_files / "simple_for_header.gm"
 
-        with open(test_file_path, "w") as f:
-            f.write("""
-namespace HeaderTest;
-
-node Test {
-    name: String
-}
-""")
+        write_fixture(test_file_path, _SRC_HEADER)
 
         # Load and generate Cypher
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
-        generator = CypherGenerator()
-        generator.generate(loaded_asts, temp_output_dir)
-
-        schema_file = os.path.join(temp_output_dir, "schema.cypher")
-        with open(schema_file, "r") as f:
-            schema_content = f.read()
+        loaded_asts = cached_loader.load(test_file_path)
+        schema_content = cypher_generator.generate(loaded_asts, temp_output_dir)[
+            "schema.cypher"
+        ]
 
         # Check for header comments
         assert "Neo4j Schema" in schema_content
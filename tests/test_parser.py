@@ -12,65 +12,179 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
-
 import pytest
+from lark.exceptions import UnexpectedInput
 
 from gmdsl.ast import (
     Document,
     EdgeDeclaration,
     NodeDeclaration,
-    RelationshipDirection,
     TypeDeclaration,
 )
 from gmdsl.parser import Parser
 
+# The longer model sources, shared at module level rather than rebuilt in each
+# test and written without indentation, so the lexer has no leading whitespace
+# to skip. The TestParser.parsed_models fixture parses each of them once.
+_SRC_COMPLEX_MODEL = """\
+namespace ComplexModel;
 
-class TestParser:
-    def test_parse_simple_model(self, setup_test_files):
-        """Test parsing a simple model with node, edge, and type declarations."""
-        test_file_path = os.path.join(setup_test_files, "simple_model.gm")
+import "CommonTypes.gm";
 
-        # Create a test file with a simple model
-        with open(test_file_path, "w") as f:
-            f.write("""
-namespace TestModel;
+type ProductDetails {
+    dimensions: String
+    weight: Float
+    color: String
+}
+
+node Customer {
+    name: String
+    email: String
+    address: Address
+    phoneNumber: String
+}
 
-type Location {
+node Order {
+    orderNumber: String
+    orderDate: Date
+    status: String
+    totalAmount: Float
+}
+
+node Product {
     name: String
-    latitude: Float
-    longitude: Float
+    price: Float
+    description: String
+    details: ProductDetails
+}
+
+edge PlacedOrder: Customer -> Order {
+    orderDate: Date
+    paymentMethod: String
+}
+
+edge ContainsProduct: Order -> Product {
+    quantity: Integer
+    unitPrice: Float
+}
+
+edge ViewedProduct: Customer -> Product {
+    viewDate: Date
+    duration: Integer
+}
+"""
+
+_SRC_TEST_COMPLEX = """\
+namespace TestComplex;
+
+type Address {
+    street: String
+    city: String
+    zipCode: String
 }
 
 node Person {
     firstName: String
     lastName: String
-    dateOfBirth: Date
-    placeOfBirth: Location
+    email: String
+    homeAddress: Address
+    workAddress: Address
+}
+
+node Company {
+    name: String
+    industry: String
+    founded: Date
+    address: Address
 }
 
-edge Friend: Person <-> Person {
-    metOn: Date
+edge WorksFor: Person -> Company {
+    position: String
+    startDate: Date
+    salary: Float
 }
 
-edge LivesIn: Person -> Location {
+edge Located: Company -> Address {}
+"""
+
+_SRC_TEST_MODEL = """\
+namespace TestModel;
+
+import "CommonTypes.gm";
+
+type Address {
+    street: String
+    city: String
+    country: String
+}
+
+node Person {
+    firstName: String
+    lastName: String
+    birthDate: Date
+    address: Address
+}
+
+node Company {
+    name: String
+    foundedDate: Date
+    location: Address
+}
+
+edge WorksAt: Person -> Company {
+    position: String
+    startDate: Date
+    salary: Float
+}
+
+edge LocatedAt: Company -> Address {}
+
+edge Manages: Person -> Person {
     since: Date
 }
-""")
+"""
+
+
+def _bucket(decls):
+    """Groups declarations by their class in a single pass."""
+    buckets = {TypeDeclaration: [], NodeDeclaration: [], EdgeDeclaration: []}
+    for d in decls:
+        buckets.setdefault(type(d), []).append(d)
+    return buckets
+
+
+class TestParser:
+    @pytest.fixture(scope="class")
+    def parser(self):
+        """A single Parser shared by all the tests in the class."""
+        return Parser()
+
+    @pytest.fixture(scope="class")
+    def parsed_models(self, parser):
+        """The module's long model sources, each parsed once for the class."""
+        return {
+            "complex_model": parser.parse(_SRC_COMPLEX_MODEL),
+            "test_complex": parser.parse(_SRC_TEST_COMPLEX),
+            "test_model": parser.parse(_SRC_TEST_MODEL),
+        }
+
+    def test_parse_simple_model(self, fixtures_dir, parser):
+        """Test parsing a simple model with node, edge, and type declarations."""
+        test_file_path = str(fixtures_dir / "parser" / "simple_model.gm")
 
-        parser = Parser()
         result = parser.parse_file(test_file_path)
 
         assert isinstance(result, Document)
-        assert result.namespace.name == "TestModel"
+        assert str(result.namespace.name) == "TestModel"
 
         # Check declarations
         assert len(result.declarations) == 4
 
         # Check if we have 1 type, 1 node, and 2 edges
-        type_decls = [d for d in result.declarations if isinstance(d, TypeDeclaration)]
-        node_decls = [d for d in result.declarations if isinstance(d, NodeDeclaration)]
-        edge_decls = [d for d in result.declarations if isinstance(d, EdgeDeclaration)]
+        buckets = _bucket(result.declarations)
+        type_decls = buckets[TypeDeclaration]
+        node_decls = buckets[NodeDeclaration]
+        edge_decls = buckets[EdgeDeclaration]
 
         assert len(type_decls) == 1
         assert len(node_decls) == 1
@@ -78,7 +192,7 @@ edge LivesIn: Person -> Location {
 
         # Check the type declaration
         location_type = type_decls[0]
-        assert location_type.name == "Location"
+        assert location_type.name.simple_name == "Location"
         assert len(location_type.properties) == 3
         assert [p.name for p in location_type.properties] == [
             "name",
@@ -93,7 +207,7 @@ edge LivesIn: Person -> Location {
 
         # Check the node declaration
         person_node = node_decls[0]
-        assert person_node.name == "Person"
+        assert person_node.name.simple_name == "Person"
         assert len(person_node.properties) == 4
         assert [p.name for p in person_node.properties] == [
             "firstName",
@@ -103,65 +217,38 @@ edge LivesIn: Person -> Location {
         ]
 
         # Check the edge declarations
-        friend_edge = next((e for e in edge_decls if e.name == "Friend"), None)
+        friend_edge = next(
+            (e for e in edge_decls if e.name.simple_name == "Friend"), None
+        )
         assert friend_edge is not None
-        assert friend_edge.source_node == "Person"
-        assert friend_edge.target_node == "Person"
+        assert friend_edge.source_node.simple_name == "Person"
+        assert friend_edge.target_node.simple_name == "Person"
+        assert friend_edge.direction == "<->"
         assert len(friend_edge.properties) == 1
         assert friend_edge.properties[0].name == "metOn"
         assert friend_edge.properties[0].type_name == "Date"
 
-        lives_in_edge = next((e for e in edge_decls if e.name == "LivesIn"), None)
+        lives_in_edge = next(
+            (e for e in edge_decls if e.name.simple_name == "LivesIn"), None
+        )
         assert lives_in_edge is not None
-        assert lives_in_edge.source_node == "Person"
-        assert lives_in_edge.target_node == "Location"
+        assert lives_in_edge.source_node.simple_name == "Person"
+        assert lives_in_edge.target_node.simple_name == "Location"
+        assert lives_in_edge.direction == "->"
         assert len(lives_in_edge.properties) == 1
         assert lives_in_edge.properties[0].name == "since"
 
-    def test_parse_model_with_imports(self, setup_test_files):
+    def test_parse_model_with_imports(self, fixtures_dir, parser):
         """Test parsing a model that imports another file."""
-        base_file_path = os.path.join(setup_test_files, "base_types.gm")
-        main_file_path = os.path.join(setup_test_files, "main_model.gm")
+        # main_model.gm imports base_types.gm
+        main_file_path = str(fixtures_dir / "parser" / "main_model.gm")
 
-        # Create base file with types
-        with open(base_file_path, "w") as f:
-            f.write("""
-namespace BaseTypes;
-
-type Location {
-    name: String
-    latitude: Float
-    longitude: Float
-}
-
-type ContactInfo {
-    email: String
-    phone: String
-}
-""")
-
-        # Create main file that imports the base file
-        with open(main_file_path, "w") as f:
-            f.write(f"""
-namespace MainModel;
-
-import "{os.path.basename(base_file_path)}";
-
-node Person {{
-    firstName: String
-    lastName: String
-    contact: ContactInfo
-    location: Location
-}}
-""")
-
-        parser = Parser()
         result = parser.parse_file(main_file_path)
 
         assert isinstance(result, Document)
-        assert result.namespace.name == "MainModel"
+        assert str(result.namespace.name) == "MainModel"
         assert len(result.imports) == 1
-        assert result.imports[0].path == f'"{os.path.basename(base_file_path)}"'
+        assert str(result.imports[0].module_name) == "base_types"
 
         # Check declarations (should have 1 node definition)
         assert len(result.declarations) == 1
@@ -169,7 +256,7 @@ node Person {{
 
         # Check the node declaration
         person_node = result.declarations[0]
-        assert person_node.name == "Person"
+        assert person_node.name.simple_name == "Person"
         assert len(person_node.properties) == 4
         assert [p.name for p in person_node.properties] == [
             "firstName",
@@ -184,63 +271,22 @@ node Person {{
             "Location",
         ]
 
-    def test_parse_complex_property_types(self, setup_test_files):
+    def test_parse_complex_property_types(self, fixtures_dir, parser):
         """Test parsing a model with complex property types and nested structures."""
-        test_file_path = os.path.join(setup_test_files, "complex_types.gm")
-
-        # Create a test file with complex types
-        with open(test_file_path, "w") as f:
-            f.write("""
-namespace ComplexTypes;
-
-type Address {
-    street: String
-    city: String
-    country: String
-    postalCode: String
-}
+        test_file_path = str(fixtures_dir / "parser" / "complex_types.gm")
 
-type ContactMethod {
-    type: String  // "email", "phone", etc.
-    value: String
-    preferred: Boolean
-}
-
-type Person {
-    name: String
-    addresses: Address   // Complex type
-    contactMethods: ContactMethod  // Another complex type
-    active: Boolean
-}
-
-node User {
-    username: String
-    password: String
-    profile: Person      // Reference to complex type with nested types
-    lastLogin: Date
-    loginCount: Integer
-}
-""")
-
-        parser = Parser()
         result = parser.parse_file(test_file_path)
 
         assert isinstance(result, Document)
-        assert result.namespace.name == "ComplexTypes"
+        assert str(result.namespace.name) == "ComplexTypes"
 
         # Check declarations
         assert len(result.declarations) == 4
+        by_name = {d.name.simple_name: d for d in result.declarations}
 
         # Find the User node
-        user_node = next(
-            (
-                d
-                for d in result.declarations
-                if isinstance(d, NodeDeclaration) and d.name == "User"
-            ),
-            None,
-        )
-        assert user_node is not None
+        user_node = by_name["User"]
+        assert isinstance(user_node, NodeDeclaration)
 
         # Check User node properties
         assert len(user_node.properties) == 5
@@ -251,15 +297,8 @@ node User {
         assert profile_prop.type_name == "Person"
 
         # Find the Person type
-        person_type = next(
-            (
-                d
-                for d in result.declarations
-                if isinstance(d, TypeDeclaration) and d.name == "Person"
-            ),
-            None,
-        )
-        assert person_type is not None
+        person_type = by_name["Person"]
+        assert isinstance(person_type, TypeDeclaration)
 
         # Check Person type properties for nested types
         assert len(person_type.properties) == 4
@@ -275,9 +314,8 @@ node User {
         assert contact_methods_prop is not None
         assert contact_methods_prop.type_name == "ContactMethod"
 
-    def test_parse_namespace(self):
+    def test_parse_namespace(self, parser):
         """Test parsing a namespace declaration."""
-        parser = Parser()
         source = "namespace TestNamespace;"
 
         result = parser.parse(source)
@@ -287,10 +325,10 @@ node User {
         assert result.namespace is not None
         assert result.namespace.name == "TestNamespace"
 
-    def test_parse_type_declaration(self):
-        """Test parsing a type declaration with properties."""
-        parser = Parser()
-        source = """
+    # (source, namespace, declaration class, name, {property: type})
+    DECLARATION_CASES = [
+        pytest.param(
+            """
         namespace TestTypes;
         
         type Address {
@@ -299,36 +337,20 @@ node User {
             zipCode: String
             country: String
         }
-        """
-
-        result = parser.parse(source)
-
-        assert len(parser.errors) == 0
-        assert isinstance(result, Document)
-        assert result.namespace.name == "TestTypes"
-
-        # Should have one type declaration
-        assert len(result.declarations) == 1
-        type_decl = result.declarations[0]
-        assert isinstance(type_decl, TypeDeclaration)
-        assert type_decl.name == "Address"
-
-        # Check properties
-        assert len(type_decl.properties) == 4
-        prop_names = [p.name for p in type_decl.properties]
-        assert "street" in prop_names
-        assert "city" in prop_names
-        assert "zipCode" in prop_names
-        assert "country" in prop_names
-
-        # Check property types
-        for prop in type_decl.properties:
-            assert prop.type_name == "String"
-
-    def test_parse_node_declaration(self):
-        """Test parsing a node declaration with properties."""
-        parser = Parser()
-        source = """
+        """,
+            "TestTypes",
+            TypeDeclaration,
+            "Address",
+            {
+                "street": "String",
+                "city": "String",
+                "zipCode": "String",
+                "country": "String",
+            },
+            id="type",
+        ),
+        pytest.param(
+            """
         namespace TestNodes;
         
         node Person {
@@ -339,42 +361,77 @@ node User {
             salary: Float
             birthDate: Date
         }
-        """
-
+        """,
+            "TestNodes",
+            NodeDeclaration,
+            "Person",
+            {
+                "firstName": "String",
+                "lastName": "String",
+                "age": "Integer",
+                "isActive": "Boolean",
+                "salary": "Float",
+                "birthDate": "Date",
+            },
+            id="node",
+        ),
+        pytest.param(
+            """
+        namespace TestNamespace;
+        
+        type Address {
+            street: String
+            city: String
+            zipCode: String
+        }
+        """,
+            "TestNamespace",
+            TypeDeclaration,
+            "Address",
+            {"street": "String", "city": "String", "zipCode": "String"},
+            id="small_type",
+        ),
+        pytest.param(
+            """
+        namespace TestNamespace;
+        
+        node Person {
+            name: String
+            age: Integer
+            isActive: Boolean
+        }
+        """,
+            "TestNamespace",
+            NodeDeclaration,
+            "Person",
+            {"name": "String", "age": "Integer", "isActive": "Boolean"},
+            id="small_node",
+        ),
+    ]
+
+    @pytest.mark.parametrize(
+        "source,namespace,decl_class,decl_name,props", DECLARATION_CASES
+    )
+    def test_parse_declaration(
+        self, parser, source, namespace, decl_class, decl_name, props
+    ):
+        """Test parsing a single type or node declaration with properties."""
         result = parser.parse(source)
 
-        assert len(parser.errors) == 0
         assert isinstance(result, Document)
-        assert result.namespace.name == "TestNodes"
+        assert result.namespace.name == namespace
 
-        # Should have one node declaration
+        # Should have exactly the one declaration
         assert len(result.declarations) == 1
-        node_decl = result.declarations[0]
-        assert isinstance(node_decl, NodeDeclaration)
-        assert node_decl.name == "Person"
-
-        # Check properties with different types
-        assert len(node_decl.properties) == 6
-
-        # Find properties by name and check their types
-        first_name_prop = next(p for p in node_decl.properties if p.name == "firstName")
-        assert first_name_prop.type_name == "String"
-
-        age_prop = next(p for p in node_decl.properties if p.name == "age")
-        assert age_prop.type_name == "Integer"
+        decl = result.declarations[0]
+        assert isinstance(decl, decl_class)
+        assert decl.name == decl_name
 
-        active_prop = next(p for p in node_decl.properties if p.name == "isActive")
-        assert active_prop.type_name == "Boolean"
+        # Check property names and types
+        assert {p.name: p.type_name for p in decl.properties} == props
 
-        salary_prop = next(p for p in node_decl.properties if p.name == "salary")
-        assert salary_prop.type_name == "Float"
-
-        birth_prop = next(p for p in node_decl.properties if p.name == "birthDate")
-        assert birth_prop.type_name == "Date"
-
-    def test_parse_edge_declarations(self):
+    def test_parse_edge_declarations(self, parser):
         """Test parsing edge declarations with different relationship directions."""
-        parser = Parser()
         source = """
         namespace TestEdges;
         
@@ -405,8 +462,9 @@ node User {
         assert len(result.declarations) == 4
 
         # Filter out node and edge declarations
-        node_decls = [d for d in result.declarations if isinstance(d, NodeDeclaration)]
-        edge_decls = [d for d in result.declarations if isinstance(d, EdgeDeclaration)]
+        buckets = _bucket(result.declarations)
+        node_decls = buckets[NodeDeclaration]
+        edge_decls = buckets[EdgeDeclaration]
 
         assert len(node_decls) == 2
         assert len(edge_decls) == 2
@@ -415,17 +473,16 @@ node User {
         acted_in_edge = next(e for e in edge_decls if e.name == "ActedIn")
         assert acted_in_edge.source_node == "Person"
         assert acted_in_edge.target_node == "Movie"
-        assert acted_in_edge.direction == RelationshipDirection.OUTGOING
+        assert acted_in_edge.direction == "->"
 
         # Check bidirectional edge (<->)
         knows_edge = next(e for e in edge_decls if e.name == "Knows")
         assert knows_edge.source_node == "Person"
         assert knows_edge.target_node == "Person"
-        assert knows_edge.direction == RelationshipDirection.BIDIRECTIONAL
+        assert knows_edge.direction == "<->"
 
-    def test_parse_imports(self):
+    def test_parse_imports(self, parser):
         """Test parsing import statements."""
-        parser = Parser()
         source = """
         namespace TestImports;
         
@@ -456,95 +513,64 @@ node User {
         assert len(node_decls) == 1
         assert node_decls[0].name == "Product"
 
-    def test_parse_complex_model(self):
+    # (parsed model, namespace, imports, {declaration class: names},
+    #  {edge: (source node, target node)})
+    COMPLEX_MODEL_CASES = [
+        pytest.param(
+            "complex_model",
+            "ComplexModel",
+            ["CommonTypes.gm"],
+            {
+                TypeDeclaration: {"ProductDetails"},
+                NodeDeclaration: {"Customer", "Order", "Product"},
+                EdgeDeclaration: {"PlacedOrder", "ContainsProduct", "ViewedProduct"},
+            },
+            {
+                "PlacedOrder": ("Customer", "Order"),
+                "ContainsProduct": ("Order", "Product"),
+            },
+            id="orders",
+        ),
+        pytest.param(
+            "test_model",
+            "TestModel",
+            ["CommonTypes.gm"],
+            {
+                TypeDeclaration: {"Address"},
+                NodeDeclaration: {"Person", "Company"},
+                EdgeDeclaration: {"WorksAt", "LocatedAt", "Manages"},
+            },
+            {"Manages": ("Person", "Person")},  # Self-reference
+            id="employment",
+        ),
+    ]
+
+    @pytest.mark.parametrize("model,namespace,imports,names,edges", COMPLEX_MODEL_CASES)
+    def test_parse_complex_model(
+        self, parsed_models, model, namespace, imports, names, edges
+    ):
         """Test parsing a complex model with multiple declarations."""
-        parser = Parser()
-        source = """
-        namespace ComplexModel;
-        
-        import "CommonTypes.gm";
-        
-        type ProductDetails {
-            dimensions: String
-            weight: Float
-            color: String
-        }
-        
-        node Customer {
-            name: String
-            email: String
-            address: Address
-            phoneNumber: String
-        }
-        
-        node Order {
-            orderNumber: String
-            orderDate: Date
-            status: String
-            totalAmount: Float
-        }
-        
-        node Product {
-            name: String
-            price: Float
-            description: String
-            details: ProductDetails
-        }
-        
-        edge PlacedOrder: Customer -> Order {
-            orderDate: Date
-            paymentMethod: String
-        }
-        
-        edge ContainsProduct: Order -> Product {
-            quantity: Integer
-            unitPrice: Float
-        }
-        
-        edge ViewedProduct: Customer -> Product {
-            viewDate: Date
-            duration: Integer
-        }
-        """
-
-        result = parser.parse(source)
+        result = parsed_models[model]
 
-        assert len(parser.errors) == 0
         assert isinstance(result, Document)
-        assert result.namespace.name == "ComplexModel"
-
-        # Check import
-        assert len(result.imports) == 1
-        assert result.imports[0].path == "CommonTypes.gm"
-
-        # Filter declarations by type
-        type_decls = [d for d in result.declarations if isinstance(d, TypeDeclaration)]
-        node_decls = [d for d in result.declarations if isinstance(d, NodeDeclaration)]
-        edge_decls = [d for d in result.declarations if isinstance(d, EdgeDeclaration)]
-
-        assert len(type_decls) == 1
-        assert len(node_decls) == 3
-        assert len(edge_decls) == 3
-
-        # Check specific nodes
-        customer_node = next(n for n in node_decls if n.name == "Customer")
-        order_node = next(n for n in node_decls if n.name == "Order")
-        product_node = next(n for n in node_decls if n.name == "Product")
+        assert result.namespace.name == namespace
+        assert [i.path for i in result.imports] == imports
+
+        # Check the declarations of each kind, indexing them in a single pass
+        by_name = {d.name: d for d in result.declarations}
+        assert {name: type(d) for name, d in by_name.items()} == {
+            name: decl_class
+            for decl_class, decl_names in names.items()
+            for name in decl_names
+        }
 
         # Check specific edges
-        placed_order_edge = next(e for e in edge_decls if e.name == "PlacedOrder")
-        assert placed_order_edge.source_node == "Customer"
-        assert placed_order_edge.target_node == "Order"
+        for edge_name, (source_node, target_node) in edges.items():
+            assert by_name[edge_name].source_node == source_node
+            assert by_name[edge_name].target_node == target_node
 
-        contains_product_edge = next(
-            e for e in edge_decls if e.name == "ContainsProduct"
-        )
-        assert contains_product_edge.source_node == "Order"
-        assert contains_product_edge.target_node == "Product"
-
-    def test_syntax_errors(self):
+    def test_syntax_errors(self, parser):
         """Test parser error handling for syntax errors."""
-        parser = Parser()
         source = """
         namespace ErrorTest;
         
@@ -566,9 +592,8 @@ node User {
         assert len(parser.errors) > 0
         # The actual content of errors will depend on the specifics of your parser implementation
 
-    def test_property_without_type(self):
+    def test_property_without_type(self, parser):
         """Test parser error handling for properties without a type."""
-        parser = Parser()
         source = """
         namespace TestMissingType;
         
@@ -589,9 +614,8 @@ node User {
             for e in parser.errors
         )
 
-    def test_basic_parsing(self):
+    def test_basic_parsing(self, parser):
         """Test basic parsing of a simple GMDSL document."""
-        parser = Parser()
         source = """
         namespace TestBasic;
         
@@ -620,9 +644,8 @@ node User {
         assert age_prop.name == "age"
         assert age_prop.type == "Integer"
 
-    def test_node_declaration(self):
+    def test_node_declaration(self, parser):
         """Test parsing of node declarations."""
-        parser = Parser()
         source = """
         namespace TestNodes;
         
@@ -661,9 +684,8 @@ node User {
         assert product.name == "Product"
         assert len(product.properties) == 0
 
-    def test_edge_declaration(self):
+    def test_edge_declaration(self, parser):
         """Test parsing of edge declarations."""
-        parser = Parser()
         source = """
         namespace TestEdges;
         
@@ -705,9 +727,8 @@ node User {
         assert viewed.to_node == "Product"
         assert len(viewed.properties) == 0
 
-    def test_type_declaration(self):
+    def test_type_declaration(self, parser):
         """Test parsing of type declarations."""
-        parser = Parser()
         source = """
         namespace TestTypes;
         
@@ -754,71 +775,40 @@ node User {
         assert geopoint_prop_types["latitude"] == "Float"
         assert geopoint_prop_types["longitude"] == "Float"
 
-    def test_complex_model(self):
+    def test_complex_model(self, parsed_models):
         """Test parsing of a complex model with multiple elements."""
-        parser = Parser()
-        source = """
-        namespace TestComplex;
-        
-        type Address {
-            street: String
-            city: String
-            zipCode: String
-        }
-        
-        node Person {
-            firstName: String
-            lastName: String
-            email: String
-            homeAddress: Address
-            workAddress: Address
-        }
-        
-        node Company {
-            name: String
-            industry: String
-            founded: Date
-            address: Address
-        }
-        
-        edge WorksFor: Person -> Company {
-            position: String
-            startDate: Date
-            salary: Float
-        }
-        
-        edge Located: Company -> Address {}
-        """
-
-        doc = parser.parse(source)
+        doc = parsed_models["test_complex"]
 
         assert isinstance(doc, Document)
         assert doc.namespace.name == "TestComplex"
         assert len(doc.declarations) == 5
 
         # Count declaration types
-        nodes = [d for d in doc.declarations if isinstance(d, NodeDeclaration)]
-        edges = [d for d in doc.declarations if isinstance(d, EdgeDeclaration)]
-        types = [d for d in doc.declarations if isinstance(d, TypeDeclaration)]
+        buckets = _bucket(doc.declarations)
+        nodes = buckets[NodeDeclaration]
+        edges = buckets[EdgeDeclaration]
+        types = buckets[TypeDeclaration]
 
         assert len(nodes) == 2
         assert len(edges) == 2
         assert len(types) == 1
 
         # Check Person node references Address type
-        person = next(n for n in nodes if n.name == "Person")
+        by_name = {d.name: d for d in doc.declarations}
+        person = by_name["Person"]
+        assert isinstance(person, NodeDeclaration)
         address_props = [p for p in person.properties if p.type == "Address"]
         assert len(address_props) == 2
 
         # Check WorksFor edge
-        works_for = next(e for e in edges if e.name == "WorksFor")
+        works_for = by_name["WorksFor"]
+        assert isinstance(works_for, EdgeDeclaration)
         assert works_for.from_node == "Person"
         assert works_for.to_node == "Company"
         assert len(works_for.properties) == 3
 
-    def test_comments(self):
+    def test_comments(self, parser):
         """Test parsing of comments in the GMDSL syntax."""
-        parser = Parser()
         source = """
         namespace TestComments;
         
@@ -843,23 +833,17 @@ node User {
         assert len(doc.declarations) == 2
 
         # Verify nodes were parsed correctly despite comments
-        person = next(
-            d
-            for d in doc.declarations
-            if isinstance(d, NodeDeclaration) and d.name == "Person"
-        )
+        by_name = {d.name: d for d in doc.declarations}
+        person = by_name["Person"]
+        assert isinstance(person, NodeDeclaration)
         assert len(person.properties) == 2
 
-        comment_node = next(
-            d
-            for d in doc.declarations
-            if isinstance(d, NodeDeclaration) and d.name == "Comment"
-        )
+        comment_node = by_name["Comment"]
+        assert isinstance(comment_node, NodeDeclaration)
         assert len(comment_node.properties) == 0
 
-    def test_array_types(self):
+    def test_array_types(self, parser):
         """Test parsing of array type declarations."""
-        parser = Parser()
         source = """
         namespace TestArrays;
         
@@ -890,9 +874,8 @@ node User {
         tags_prop = next(p for p in address.properties if p.name == "tags")
         assert tags_prop.type == "[String]"
 
-    def test_invalid_syntax(self):
+    def test_invalid_syntax(self, parser):
         """Test parser behavior with invalid syntax."""
-        parser = Parser()
         invalid_source = """
         namespace TestInvalid
         
@@ -902,12 +885,11 @@ node User {
         }
         """
 
-        with pytest.raises(Exception):
+        with pytest.raises(UnexpectedInput):
             parser.parse(invalid_source)
 
-    def test_empty_document(self):
+    def test_empty_document(self, parser):
         """Test parsing of an empty document."""
-        parser = Parser()
         empty_source = """
         // Just a comment, no actual declarations
         """
@@ -916,9 +898,8 @@ node User {
             # Should raise an exception because no namespace is defined
             parser.parse(empty_source)
 
-    def test_namespace_only(self):
+    def test_namespace_only(self, parser):
         """Test parsing of a document with only a namespace."""
-        parser = Parser()
         namespace_source = """
         namespace EmptyNamespace;
         """
@@ -929,79 +910,27 @@ node User {
         assert doc.namespace.name == "EmptyNamespace"
         assert len(doc.declarations) == 0
 
-    def test_parse_empty_file(self):
+    def test_parse_empty_file(self, parser):
         """Test parsing an empty file."""
-        parser = Parser()
         ast = parser.parse("")
         assert ast is not None
         assert ast.namespace is None
         assert len(ast.declarations) == 0
         assert len(ast.imports) == 0
 
-    def test_parse_namespace_only(self):
+    def test_parse_namespace_only(self, parser):
         """Test parsing a file with only a namespace declaration."""
-        parser = Parser()
         ast = parser.parse("namespace TestNamespace;")
         assert ast is not None
         assert ast.namespace is not None
         assert ast.namespace.name == "TestNamespace"
         assert len(ast.declarations) == 0
 
-    def test_parse_node_declaration(self):
-        """Test parsing a node declaration."""
-        parser = Parser()
-        source = """
-        namespace TestNamespace;
-        
-        node Person {
-            name: String
-            age: Integer
-            isActive: Boolean
-        }
-        """
-        ast = parser.parse(source)
-        assert ast is not None
-        assert ast.namespace.name == "TestNamespace"
-        assert len(ast.declarations) == 1
-
-        node = ast.declarations[0]
-        assert node.name == "Person"
-        assert len(node.properties) == 3
-
-        props = {p.name: p.type_name for p in node.properties}
-        assert props["name"] == "String"
-        assert props["age"] == "Integer"
-        assert props["isActive"] == "Boolean"
-
-    def test_parse_type_declaration(self):
-        """Test parsing a type declaration."""
-        parser = Parser()
-        source = """
-        namespace TestNamespace;
-        
-        type Address {
-            street: String
-            city: String
-            zipCode: String
-        }
-        """
-        ast = parser.parse(source)
-        assert ast is not None
-        assert len(ast.declarations) == 1
-
-        type_decl = ast.declarations[0]
-        assert type_decl.name == "Address"
-        assert len(type_decl.properties) == 3
-
-        props = {p.name: p.type_name for p in type_decl.properties}
-        assert props["street"] == "String"
-        assert props["city"] == "String"
-        assert props["zipCode"] == "String"
-
-    def test_parse_edge_declaration(self):
-        """Test parsing an edge declaration."""
-        parser = Parser()
-        source = """
+    # (source, number of declarations, edge name, source node, target node,
+    #  direction, {property: type})
+    EDGE_CASES = [
+        pytest.param(
+            """
         namespace TestNamespace;
         
         node Person { name: String }
@@ -1011,26 +940,17 @@ node User {
             position: String
             startDate: Date
         }
-        """
-        ast = parser.parse(source)
-        assert ast is not None
-        assert len(ast.declarations) == 3
-
-        edge = [d for d in ast.declarations if hasattr(d, "source_node")][0]
-        assert edge.name == "WorksAt"
-        assert edge.source_node == "Person"
-        assert edge.target_node == "Company"
-        assert edge.direction == "->"
-        assert len(edge.properties) == 2
-
-        props = {p.name: p.type_name for p in edge.properties}
-        assert props["position"] == "String"
-        assert props["startDate"] == "Date"
-
-    def test_parse_bidirectional_edge(self):
-        """Test parsing a bidirectional edge."""
-        parser = Parser()
-        source = """
+        """,
+            3,
+            "WorksAt",
+            "Person",
+            "Company",
+            "->",
+            {"position": "String", "startDate": "Date"},
+            id="directed",
+        ),
+        pytest.param(
+            """
         namespace TestNamespace;
         
         node Person { name: String }
@@ -1038,21 +958,60 @@ node User {
         edge Friend: Person <-> Person {
             since: Date
         }
-        """
+        """,
+            2,
+            "Friend",
+            "Person",
+            "Person",
+            "<->",
+            {"since": "Date"},
+            id="bidirectional",
+        ),
+    ]
+
+    @pytest.mark.parametrize(
+        "source,decl_count,edge_name,source_node,target_node,direction,props",
+        EDGE_CASES,
+    )
+    def test_parse_edge_declaration(
+        self,
+        parser,
+        source,
+        decl_count,
+        edge_name,
+        source_node,
+        target_node,
+        direction,
+        props,
+    ):
+        """Test parsing a single edge declaration."""
         ast = parser.parse(source)
         assert ast is not None
+        assert len(ast.declarations) == decl_count
+
+        edge = next(d for d in ast.declarations if isinstance(d, EdgeDeclaration))
+        assert edge.name == edge_name
+        assert edge.source_node == source_node
+        assert edge.target_node == target_node
+        assert edge.direction == direction
+        assert {p.name: p.type_name for p in edge.properties} == props
+
+    def test_parse_edge_direction(self, parser):
+        """Test that each edge keeps the direction it was declared with."""
+        result = parser.parse(
+            "namespace Ex\nnode A {\n}\nnode B {\n}\n"
+            "edge E(A <-> B)\nedge F(A -> B)\n"
+        )
 
-        edge = [d for d in ast.declarations if hasattr(d, "source_node")][0]
-        assert edge.name == "Friend"
-        assert edge.source_node == "Person"
-        assert edge.target_node == "Person"
-        assert "<->" in str(edge.direction)  # Direction might be a Tree object
-        assert len(edge.properties) == 1
-        assert edge.properties[0].name == "since"
+        directions = {
+            str(d.name): d.direction
+            for d in result.declarations
+            if isinstance(d, EdgeDeclaration)
+        }
+        assert directions == {"Ex.E": "<->", "Ex.F": "->"}
 
-    def test_parse_import_declaration(self):
+    def test_parse_import_declaration(self, parser):
         """Test parsing an import statement."""
-        parser = Parser()
         source = """
         namespace TestNamespace;
         
@@ -1067,88 +1026,11 @@ node User {
         assert len(ast.imports) == 1
         assert ast.imports[0].path == "BaseTypes.gm"
 
-    def test_parse_complex_model(self):
-        """Test parsing a complex model with multiple declarations."""
-        parser = Parser()
-        source = """
-        namespace TestModel;
-        
-        import "CommonTypes.gm";
-        
-        type Address {
-            street: String
-            city: String
-            country: String
-        }
-        
-        node Person {
-            firstName: String
-            lastName: String
-            birthDate: Date
-            address: Address
-        }
-        
-        node Company {
-            name: String
-            foundedDate: Date
-            location: Address
-        }
-        
-        edge WorksAt: Person -> Company {
-            position: String
-            startDate: Date
-            salary: Float
-        }
-        
-        edge LocatedAt: Company -> Address {}
-        
-        edge Manages: Person -> Person {
-            since: Date
-        }
-        """
-        ast = parser.parse(source)
-        assert ast is not None
-        assert ast.namespace.name == "TestModel"
-        assert len(ast.imports) == 1
-        assert len(ast.declarations) == 5
-
-        # Count declarations by type
-        node_count = len(
-            [
-                d
-                for d in ast.declarations
-                if hasattr(d, "properties") and not hasattr(d, "source_node")
-            ]
-        )
-        type_count = len(
-            [
-                d
-                for d in ast.declarations
-                if hasattr(d, "properties")
-                and not hasattr(d, "source_node")
-                and not hasattr(d, "name")
-                or (hasattr(d, "name") and d.name in ["Address"])
-            ]
-        )
-        edge_count = len([d for d in ast.declarations if hasattr(d, "source_node")])
-
-        assert node_count >= 2  # Person and Company
-        assert type_count >= 1  # Address
-        assert edge_count == 3  # WorksAt, LocatedAt, Manages
-
-        # Check self-reference edge
-        manages_edge = [
-            d for d in ast.declarations if hasattr(d, "name") and d.name == "Manages"
-        ][0]
-        assert manages_edge.source_node == "Person"
-        assert manages_edge.target_node == "Person"
-
-    def test_parse_error_handling(self):
+    def test_parse_error_handling(self, parser):
         """Test parser error handling with invalid syntax."""
-        parser = Parser()
 
         # Missing closing brace
-        with pytest.raises(Exception):
+        with pytest.raises(UnexpectedInput):
             parser.parse("""
             namespace TestNamespace;
             
@@ -1157,7 +1039,7 @@ node User {
             """)
 
         # Invalid edge syntax
-        with pytest.raises(Exception):
+        with pytest.raises(UnexpectedInput):
             parser.parse("""
             namespace TestNamespace;
             
@@ -1167,7 +1049,7 @@ node User {
             """)
 
         # Missing type name
-        with pytest.raises(Exception):
+        with pytest.raises(UnexpectedInput):
             parser.parse("""
             namespace TestNamespace;
             
@@ -1176,9 +1058,8 @@ node User {
             }
             """)
 
-    def test_parse_with_comments(self):
+    def test_parse_with_comments(self, parser):
         """Test parsing a file with comments."""
-        parser = Parser()
         source = """
         // This is a comment
         namespace TestNamespace;
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
+import functools
+import re
+from dataclasses import replace
 
 import pytest
 
@@ -20,7 +22,6 @@ from gmdsl.ast import (
     Document,
     EdgeDeclaration,
     Import,
-    ImportDeclaration,
     Namespace,
     NamespaceDeclaration,
     NodeDeclaration,
@@ -30,25 +31,58 @@ from gmdsl.ast import (
     Scalar,
     TypeDeclaration,
 )
-from gmdsl.loader import AstLoader
 from gmdsl.parser import Parser
 from gmdsl.validation import (
     AstValidator,
     ModelValidator,
-    ValidationError,
     Validator,
     validate_asts,
 )
 
 
-class TestValidation:
-    def test_valid_model(self, setup_test_files):
-        """Test validation with a valid model that should pass all checks."""
-        test_file_path = os.path.join(setup_test_files, "valid_model.gm")
+def _index_errors(errors):
+    """Maps each word of the error messages to the errors that contain it, in order."""
+    index = {}
+    for error in errors:
+        for word in dict.fromkeys(re.findall(r"\w+", error.message)):
+            index.setdefault(word, []).append(error)
+    return index
+
+
+_shared_parser = Parser()
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_cached(src):
+    """Parses a model source once per process; the Document is shared."""
+    return _shared_parser.parse(src)
+
+
+def _parse(src, source_path=None):
+    """Returns the cached parse of src with its own top-level lists.
+
+    The validator replaces declarations in place, so each test gets fresh lists
+    rather than the shared Document itself.
+    """
+    doc = _parse_cached(src)
+    return replace(
+        doc,
+        source_path=source_path,
+        imports=list(doc.imports),
+        declarations=list(doc.declarations),
+    )
+
+
+def _load_source(source, path):
+    """Parses a model in memory into the {path: Document} mapping AstLoader.load returns."""
+    return {path: _parse(source, source_path=path)}
 
-        # Create a test file with a valid model
-        with open(test_file_path, "w") as f:
-            f.write("""
+
+# The TestValidation models, shared at module level rather than rebuilt in each
+# test.
+
+# A valid model
+_SRC_VALID_MODEL = """\
 namespace ValidModel;
 
 type Address {
@@ -75,24 +109,10 @@ edge WorksFor: Person -> Company {
 edge LivesAt: Person -> Address {
     isPrimary: Boolean
 }
-""")
-
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
-
-        # Validate the loaded ASTs
-        validation_errors = validate_asts(loaded_asts)
-
-        # Should have no validation errors
-        assert len(validation_errors) == 0
-
-    def test_undefined_type_reference(self, setup_test_files):
-        """Test validation with references to undefined types."""
-        test_file_path = os.path.join(setup_test_files, "undefined_type.gm")
+"""
 
-        # Create a test file with an undefined type reference
-        with open(test_file_path, "w") as f:
-            f.write("""
+# A model with an undefined type reference
+_SRC_UNDEFINED_TYPE = """\
 namespace UndefinedTypeTest;
 
 node Person {
@@ -103,38 +123,10 @@ node Person {
 edge LivesAt: Person -> Location {  // Location node is not defined
     since: Date
 }
-""")
+"""
 
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
-
-        # Validate the loaded ASTs
-        validation_errors = validate_asts(loaded_asts)
-
-        # Should have validation errors for undefined types
-        assert len(validation_errors) == 2
-
-        # Check that we have an error about the undefined Address type
-        address_error = next(
-            (e for e in validation_errors if "Address" in e.message), None
-        )
-        assert address_error is not None
-        assert "undefined type" in address_error.message.lower()
-
-        # Check that we have an error about the undefined Location node
-        location_error = next(
-            (e for e in validation_errors if "Location" in e.message), None
-        )
-        assert location_error is not None
-        assert "target node" in location_error.message.lower()
-
-    def test_duplicate_declarations(self, setup_test_files):
-        """Test validation with duplicate declarations."""
-        test_file_path = os.path.join(setup_test_files, "duplicate_declarations.gm")
-
-        # Create a test file with duplicate declarations
-        with open(test_file_path, "w") as f:
-            f.write("""
+# A model with duplicate declarations
+_SRC_DUPLICATE_DECLARATIONS = """\
 namespace DuplicateTest;
 
 type Address {
@@ -166,55 +158,10 @@ edge WorksFor: Person -> Company {  // Duplicate edge declaration
 node Company {
     name: String
 }
-""")
-
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
-
-        # Validate the loaded ASTs
-        validation_errors = validate_asts(loaded_asts)
-
-        # Should have validation errors for duplicates
-        assert len(validation_errors) == 3
-
-        # Check for duplicate type error
-        type_error = next(
-            (
-                e
-                for e in validation_errors
-                if "Address" in e.message and "type" in e.message.lower()
-            ),
-            None,
-        )
-        assert type_error is not None
-        assert "duplicate" in type_error.message.lower()
-
-        # Check for duplicate node error
-        node_error = next(
-            (
-                e
-                for e in validation_errors
-                if "Person" in e.message and "node" in e.message.lower()
-            ),
-            None,
-        )
-        assert node_error is not None
-        assert "duplicate" in node_error.message.lower()
+"""
 
-        # Check for duplicate edge error
-        edge_error = next(
-            (e for e in validation_errors if "WorksFor" in e.message), None
-        )
-        assert edge_error is not None
-        assert "duplicate" in edge_error.message.lower()
-
-    def test_property_type_validation(self, setup_test_files):
-        """Test validation of property types including primitive and custom types."""
-        test_file_path = os.path.join(setup_test_files, "property_types.gm")
-
-        # Create a test file with various property type usages
-        with open(test_file_path, "w") as f:
-            f.write("""
+# A model with various property type usages
+_SRC_PROPERTY_TYPES = """\
 namespace PropertyTypesTest;
 
 type Address {
@@ -237,38 +184,10 @@ edge LivesAt: Person -> Address {
     primaryResidence: Boolean   // Valid primitive type
     invalidProp: NonExistent    // Invalid type - doesn't exist
 }
-""")
-
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
-
-        # Validate the loaded ASTs
-        validation_errors = validate_asts(loaded_asts)
-
-        # Should have validation errors for undefined types
-        assert len(validation_errors) == 2
+"""
 
-        # Check for error about Unknown type
-        unknown_error = next(
-            (e for e in validation_errors if "Unknown" in e.message), None
-        )
-        assert unknown_error is not None
-        assert "undefined type" in unknown_error.message.lower()
-
-        # Check for error about NonExistent type
-        nonexistent_error = next(
-            (e for e in validation_errors if "NonExistent" in e.message), None
-        )
-        assert nonexistent_error is not None
-        assert "undefined type" in nonexistent_error.message.lower()
-
-    def test_edge_reference_validation(self, setup_test_files):
-        """Test validation of edge source and target references."""
-        test_file_path = os.path.join(setup_test_files, "edge_references.gm")
-
-        # Create a test file with edge reference issues
-        with open(test_file_path, "w") as f:
-            f.write("""
+# A model with edge reference issues
+_SRC_EDGE_REFERENCES = """\
 namespace EdgeReferenceTest;
 
 node Person {
@@ -299,13 +218,111 @@ edge InvalidTarget: Person -> NonExistentNode {  // Invalid target node
 edge InvalidTypeReference: Person -> Address {  // Invalid - Address is a type, not a node
     isPrimary: Boolean
 }
-""")
+"""
+
+
+class TestValidation:
+    def test_valid_model(self):
+        """Test validation with a valid model that should pass all checks."""
+        loaded_asts = _load_source(_SRC_VALID_MODEL, "valid_model.gm")
+
+        # Validate the loaded ASTs
+        validation_errors = validate_asts(loaded_asts)
+
+        # Should have no validation errors
+        assert len(validation_errors) == 0
+
+    def test_undefined_type_reference(self):
+        """Test validation with references to undefined types."""
+        loaded_asts = _load_source(_SRC_UNDEFINED_TYPE, "undefined_type.gm")
+
+        # Validate the loaded ASTs
+        validation_errors = validate_asts(loaded_asts)
+        errors_by_word = _index_errors(validation_errors)
 
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
+        # Should have validation errors for undefined types
+        assert len(validation_errors) == 2
+
+        # Check that we have an error about the undefined Address type
+        address_error = errors_by_word.get("Address", [None])[0]
+        assert address_error is not None
+        assert "undefined type" in address_error.message.lower()
+
+        # Check that we have an error about the undefined Location node
+        location_error = errors_by_word.get("Location", [None])[0]
+        assert location_error is not None
+        assert "target node" in location_error.message.lower()
+
+    def test_duplicate_declarations(self):
+        """Test validation with duplicate declarations."""
+        loaded_asts = _load_source(
+            _SRC_DUPLICATE_DECLARATIONS, "duplicate_declarations.gm"
+        )
 
         # Validate the loaded ASTs
         validation_errors = validate_asts(loaded_asts)
+        errors_by_word = _index_errors(validation_errors)
+
+        # Should have validation errors for duplicates
+        assert len(validation_errors) == 3
+
+        # Check for duplicate type error
+        type_error = next(
+            (
+                e
+                for e in errors_by_word.get("Address", ())
+                if "type" in e.message.lower()
+            ),
+            None,
+        )
+        assert type_error is not None
+        assert "duplicate" in type_error.message.lower()
+
+        # Check for duplicate node error
+        node_error = next(
+            (
+                e
+                for e in errors_by_word.get("Person", ())
+                if "node" in e.message.lower()
+            ),
+            None,
+        )
+        assert node_error is not None
+        assert "duplicate" in node_error.message.lower()
+
+        # Check for duplicate edge error
+        edge_error = errors_by_word.get("WorksFor", [None])[0]
+        assert edge_error is not None
+        assert "duplicate" in edge_error.message.lower()
+
+    def test_property_type_validation(self):
+        """Test validation of property types including primitive and custom types."""
+        loaded_asts = _load_source(_SRC_PROPERTY_TYPES, "property_types.gm")
+
+        # Validate the loaded ASTs
+        validation_errors = validate_asts(loaded_asts)
+        errors_by_word = _index_errors(validation_errors)
+
+        # Should have validation errors for undefined types
+        assert len(validation_errors) == 2
+
+        # Check for error about Unknown type
+        unknown_error = errors_by_word.get("Unknown", [None])[0]
+        assert unknown_error is not None
+        assert "undefined type" in unknown_error.message.lower()
+
+        # Check for error about NonExistent type
+        nonexistent_error = errors_by_word.get("NonExistent", [None])[0]
+        assert nonexistent_error is not None
+        assert "undefined type" in nonexistent_error.message.lower()
+
+    def test_edge_reference_validation(self):
+        """Test validation of edge source and target references."""
+        loaded_asts = _load_source(_SRC_EDGE_REFERENCES, "edge_references.gm")
+
+        # Validate the loaded ASTs
+        validation_errors = validate_asts(loaded_asts)
+        errors_by_word = _index_errors(validation_errors)
 
         # Should have validation errors for edge references
         assert len(validation_errors) == 3
@@ -314,8 +331,8 @@ edge InvalidTypeReference: Person -> Address {  // Invalid - Address is a type,
         source_error = next(
             (
                 e
-                for e in validation_errors
-                if "NonExistentNode" in e.message and "source" in e.message.lower()
+                for e in errors_by_word.get("NonExistentNode", ())
+                if "source" in e.message.lower()
             ),
             None,
         )
@@ -325,25 +342,27 @@ edge InvalidTypeReference: Person -> Address {  // Invalid - Address is a type,
         target_error = next(
             (
                 e
-                for e in validation_errors
-                if "NonExistentNode" in e.message and "target" in e.message.lower()
+                for e in errors_by_word.get("NonExistentNode", ())
+                if "target" in e.message.lower()
             ),
             None,
         )
         assert target_error is not None
 
         # Check for error about Address as target (type used where node expected)
-        type_error = next(
-            (e for e in validation_errors if "Address" in e.message), None
-        )
+        type_error = errors_by_word.get("Address", [None])[0]
         assert type_error is not None
         assert "node" in type_error.message.lower()
 
 
 class TestValidator:
-    def test_duplicate_declaration_names(self):
+    @pytest.fixture(scope="class")
+    def validator(self):
+        """A single Validator shared by the class; validate() resets its state."""
+        return Validator()
+
+    def test_duplicate_declaration_names(self, validator):
         """Test validation of duplicate declaration names."""
-        parser = Parser()
         source = """
         namespace TestDuplicates;
         
@@ -358,19 +377,15 @@ class TestValidator:
         }
         """
 
-        doc = parser.parse(source)
-        validator = Validator()
+        doc = _parse(source)
         errors = validator.validate(doc)
+        messages = [e.message.lower() for e in errors]
 
         # Should have validation error about duplicate node names
-        assert any(
-            e.message.lower().find("duplicate") >= 0 and "person" in e.message.lower()
-            for e in errors
-        )
+        assert any("duplicate" in m and "person" in m for m in messages)
 
-    def test_undefined_type_references(self):
+    def test_undefined_type_references(self, validator):
         """Test validation of undefined type references."""
-        parser = Parser()
         source = """
         namespace TestUndefinedTypes;
         
@@ -380,19 +395,15 @@ class TestValidator:
         }
         """
 
-        doc = parser.parse(source)
-        validator = Validator()
+        doc = _parse(source)
         errors = validator.validate(doc)
+        messages = [e.message.lower() for e in errors]
 
         # Should have validation error about undefined type
-        assert any(
-            "address" in e.message.lower() and "undefined" in e.message.lower()
-            for e in errors
-        )
+        assert any("address" in m and "undefined" in m for m in messages)
 
-    def test_edge_with_undefined_nodes(self):
+    def test_edge_with_undefined_nodes(self, validator):
         """Test validation of edge references to undefined nodes."""
-        parser = Parser()
         source = """
         namespace TestUndefinedNodes;
         
@@ -406,19 +417,15 @@ class TestValidator:
         }
         """
 
-        doc = parser.parse(source)
-        validator = Validator()
+        doc = _parse(source)
         errors = validator.validate(doc)
+        messages = [e.message.lower() for e in errors]
 
         # Should have validation error about undefined node reference
-        assert any(
-            "order" in e.message.lower() and "undefined" in e.message.lower()
-            for e in errors
-        )
+        assert any("order" in m and "undefined" in m for m in messages)
 
-    def test_self_referential_types(self):
+    def test_self_referential_types(self, validator):
         """Test validation of self-referential type definitions."""
-        parser = Parser()
         source = """
         namespace TestSelfReference;
         
@@ -428,19 +435,15 @@ class TestValidator:
         }
         """
 
-        doc = parser.parse(source)
-        validator = Validator()
+        doc = _parse(source)
         errors = validator.validate(doc)
+        messages = [e.message.lower() for e in errors]
 
         # Should not have errors for self-references
-        assert not any(
-            "friend" in e.message.lower() and "reference" in e.message.lower()
-            for e in errors
-        )
+        assert not any("friend" in m and "reference" in m for m in messages)
 
-    def test_circular_type_references(self):
+    def test_circular_type_references(self, validator):
         """Test validation of circular type references."""
-        parser = Parser()
         source = """
         namespace TestCircularReferences;
         
@@ -455,19 +458,15 @@ class TestValidator:
         }
         """
 
-        doc = parser.parse(source)
-        validator = Validator()
+        doc = _parse(source)
         errors = validator.validate(doc)
+        messages = [e.message.lower() for e in errors]
 
         # Circular references are allowed in graph models, so there should be no errors
-        assert not any(
-            "circular" in e.message.lower() or "recursive" in e.message.lower()
-            for e in errors
-        )
+        assert not any("circular" in m or "recursive" in m for m in messages)
 
-    def test_invalid_property_types(self):
+    def test_invalid_property_types(self, validator):
         """Test validation of invalid property types."""
-        parser = Parser()
         source = """
         namespace TestInvalidTypes;
         
@@ -477,18 +476,15 @@ class TestValidator:
         }
         """
 
-        doc = parser.parse(source)
-        validator = Validator()
+        doc = _parse(source)
         errors = validator.validate(doc)
+        messages = [e.message.lower() for e in errors]
 
         # Should have validation error about undefined type
-        assert any(
-            "money" in e.message.lower() and "type" in e.message.lower() for e in errors
-        )
+        assert any("money" in m and "type" in m for m in messages)
 
-    def test_invalid_relationships(self):
+    def test_invalid_relationships(self, validator):
         """Test validation of invalid relationship definitions."""
-        parser = Parser()
         source = """
         namespace TestInvalidRelationships;
         
@@ -502,16 +498,15 @@ class TestValidator:
         }
         """
 
-        doc = parser.parse(source)
-        validator = Validator()
+        doc = _parse(source)
         errors = validator.validate(doc)
+        messages = [e.message.lower() for e in errors]
 
         # Should have validation error about undefined node reference
-        assert any("movie" in e.message.lower() for e in errors)
+        assert any("movie" in m for m in messages)
 
-    def test_reserved_keywords(self):
+    def test_reserved_keywords(self, validator):
         """Test validation against usage of reserved keywords as names."""
-        parser = Parser()
         source = """
         namespace TestReservedKeywords;
         
@@ -520,19 +515,15 @@ class TestValidator:
         }
         """
 
-        doc = parser.parse(source)
-        validator = Validator()
+        doc = _parse(source)
         errors = validator.validate(doc)
+        messages = [e.message.lower() for e in errors]
 
         # Should have validation error about reserved keyword usage
-        assert any(
-            "node" in e.message.lower() and "reserved" in e.message.lower()
-            for e in errors
-        )
+        assert any("node" in m and "reserved" in m for m in messages)
 
-    def test_multiple_namespaces(self):
+    def test_multiple_namespaces(self, validator):
         """Test validation against multiple namespace declarations."""
-        parser = Parser()
         source = """
         namespace First;
         
@@ -547,22 +538,18 @@ class TestValidator:
         }
         """
 
-        doc = parser.parse(source)
-        validator = Validator()
+        doc = _parse(source)
         errors = validator.validate(doc)
+        messages = [e.message.lower() for e in errors]
 
         # Should have validation error about multiple namespaces
         assert any(
-            "namespace" in e.message.lower()
-            and (
-                "multiple" in e.message.lower() or "more than one" in e.message.lower()
-            )
-            for e in errors
+            "namespace" in m and ("multiple" in m or "more than one" in m)
+            for m in messages
         )
 
-    def test_valid_model(self):
+    def test_valid_model(self, validator):
         """Test validation of a fully valid model."""
-        parser = Parser()
         source = """
         namespace ValidModel;
         
@@ -590,22 +577,121 @@ class TestValidator:
         }
         """
 
-        doc = parser.parse(source)
-        validator = Validator()
+        doc = _parse(source)
         errors = validator.validate(doc)
 
         # Should have no validation errors
         assert len(errors) == 0
 
 
-class TestAstValidator:
-    def test_valid_document(self, setup_test_files):
-        """Test validation of a valid document."""
-        test_file_path = os.path.join(setup_test_files, "valid_model.gm")
+# The import models written by the TestAstValidator import tests. Models that
+# import another file name it literally; the test writes it under that name.
+
+_SRC_BASE_TYPES = """\
+namespace BaseTypes;
+
+type Location {
+    name: String
+    latitude: Float
+    longitude: Float
+}
+"""
+
+_SRC_MAIN_VALID = """\
+namespace MainModel;
+
+import "base_types.gm";
+
+node Person {
+    name: String
+    home: BaseTypes.Location
+}
+"""
+
+_SRC_BASE_TYPES_LOCATION_ONLY = """\
+namespace BaseTypes;
+
+type Location {
+    name: String
+}
+"""
+
+_SRC_MAIN_INVALID = """\
+namespace MainModel;
+
+import "base_types_invalid.gm";
+
+node Person {
+    name: String
+    home: BaseTypes.Address  // Address doesn't exist in BaseTypes
+}
+"""
+
+_SRC_MAIN_MISSING_IMPORT = """\
+namespace MainModel;
+
+import "NonExistentFile.gm";
+
+node Person {
+    name: String
+}
+"""
+
+_SRC_TYPES_MODULE = """\
+namespace Types;
+
+type Location {
+    latitude: Float
+    longitude: Float
+    name: String
+}
+
+type ContactInfo {
+    email: String
+    phone: String
+}
+"""
+
+_SRC_NODES_MODULE = """\
+namespace Nodes;
+
+import "types_module.gm";
+
+node Person {
+    firstName: String
+    lastName: String
+    contact: Types.ContactInfo
+    homeLocation: Types.Location
+}
+
+node Place {
+    name: String
+    location: Types.Location
+}
+"""
+
+_SRC_EDGES_MODULE = """\
+namespace Edges;
+
+import "nodes_module.gm";
 
-        # Create a test file with a valid model
-        with open(test_file_path, "w") as f:
-            f.write("""
+edge VisitedPlace: Nodes.Person -> Nodes.Place {
+    visitDate: Date
+    rating: Integer
+}
+"""
+
+
+class TestAstValidator:
+    @pytest.fixture(scope="class")
+    def validator(self):
+        """A single AstValidator shared by the class."""
+        return AstValidator()
+
+    # (source, path) of models that must validate without errors
+    VALID_DOCUMENT_CASES = [
+        pytest.param(
+            """
 namespace ValidModel;
 
 type Location {
@@ -631,87 +717,130 @@ edge WorksAt: Person -> Company {
     position: String
     startDate: Date
 }
-""")
-
-        # Load the AST
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
-
-        # Validate the AST
-        validator = AstValidator()
-        validation_result = validator.validate(loaded_asts)
-
-        # Should be valid with no errors
-        assert validation_result.is_valid
-        assert len(validation_result.errors) == 0
+""",
+            "valid_model.gm",
+            id="basic",
+        ),
+        pytest.param(
+            """
+namespace PrimitiveTypesTest;
 
-    def test_duplicate_node_declarations(self, setup_test_files):
-        """Test validation detects duplicate node declarations."""
-        test_file_path = os.path.join(setup_test_files, "duplicate_nodes.gm")
+node TestPrimitives {
+    stringValue: String
+    intValue: Integer
+    floatValue: Float
+    boolValue: Boolean
+    dateValue: Date
+}
+""",
+            "valid_primitives.gm",
+            id="primitive_types",
+        ),
+        pytest.param(
+            """
+namespace ComplexValidation;
 
-        # Create a test file with duplicate node declarations
-        with open(test_file_path, "w") as f:
-            f.write("""
-namespace DuplicateTest;
+type Address {
+    street: String
+    city: String
+    country: String
+}
 
-node Person {
-    name: String
+type ContactInfo {
+    email: String
+    phone: String
 }
 
 node Person {
     firstName: String
     lastName: String
+    birthDate: Date
+    address: Address
+    contact: ContactInfo
 }
-""")
 
-        # Load the AST
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
-
-        # Validate the AST
-        validator = AstValidator()
-        validation_result = validator.validate(loaded_asts)
+node Organization {
+    name: String
+    founded: Date
+    address: Address
+}
 
-        # Should be invalid with error about duplicate declaration
-        assert not validation_result.is_valid
-        assert len(validation_result.errors) > 0
-        assert any("duplicate" in err.lower() for err in validation_result.errors)
+node Department {
+    name: String
+    budget: Float
+}
 
-    def test_unknown_type_reference(self, setup_test_files):
-        """Test validation detects references to unknown types."""
-        test_file_path = os.path.join(setup_test_files, "unknown_type.gm")
+edge BelongsTo: Department -> Organization {}
 
-        # Create a test file with reference to unknown type
-        with open(test_file_path, "w") as f:
-            f.write("""
-namespace UnknownTypeTest;
+edge WorksIn: Person -> Department {
+    role: String
+    since: Date
+}
 
-node Person {
-    name: String
-    address: Address  // Address type is not defined
+edge WorksFor: Person -> Organization {
+    position: String
+    salary: Float
 }
-""")
 
+edge LivesAt: Person -> Address {}
+
+edge Knows: Person <-> Person {
+    since: Date
+}
+""",
+            "complex_validation.gm",
+            id="complex_scenario",
+            marks=pytest.mark.slow,
+        ),
+    ]
+
+    @pytest.mark.parametrize("source,path", VALID_DOCUMENT_CASES)
+    def test_valid_document(self, validator, source, path):
+        """Test validation of valid documents."""
         # Load the AST
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
+        loaded_asts = _load_source(source, path)
 
         # Validate the AST
-        validator = AstValidator()
         validation_result = validator.validate(loaded_asts)
 
-        # Should be invalid with error about unknown type
-        assert not validation_result.is_valid
-        assert len(validation_result.errors) > 0
-        assert any("unknown type" in err.lower() for err in validation_result.errors)
+        # Should be valid with no errors
+        assert validation_result.is_valid
+        assert len(validation_result.errors) == 0
+
+    # (source, path, text expected in the errors) of models that must fail
+    INVALID_DOCUMENT_CASES = [
+        pytest.param(
+            """
+namespace DuplicateTest;
+
+node Person {
+    name: String
+}
 
-    def test_invalid_edge_reference(self, setup_test_files):
-        """Test validation detects edges referencing undefined nodes."""
-        test_file_path = os.path.join(setup_test_files, "invalid_edge.gm")
+node Person {
+    firstName: String
+    lastName: String
+}
+""",
+            "duplicate_nodes.gm",
+            "duplicate",
+            id="duplicate_nodes",
+        ),
+        pytest.param(
+            """
+namespace UnknownTypeTest;
 
-        # Create a test file with edge referencing undefined nodes
-        with open(test_file_path, "w") as f:
-            f.write("""
+node Person {
+    name: String
+    address: Address  // Address type is not defined
+}
+""",
+            "unknown_type.gm",
+            "unknown type",
+            id="unknown_type",
+        ),
+        pytest.param(
+            """
 namespace InvalidEdgeTest;
 
 node Person {
@@ -721,86 +850,44 @@ node Person {
 edge WorksAt: Person -> Company {  // Company is not defined
     position: String
 }
-""")
-
-        # Load the AST
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
-
-        # Validate the AST
-        validator = AstValidator()
-        validation_result = validator.validate(loaded_asts)
-
-        # Should be invalid with error about undefined node
-        assert not validation_result.is_valid
-        assert len(validation_result.errors) > 0
-        assert any("undefined node" in err.lower() for err in validation_result.errors)
-
-    def test_invalid_property_type(self, setup_test_files):
-        """Test validation detects invalid property types."""
-        test_file_path = os.path.join(setup_test_files, "invalid_property.gm")
-
-        # Create a test file with invalid property type
-        with open(test_file_path, "w") as f:
-            f.write("""
+""",
+            "invalid_edge.gm",
+            "undefined node",
+            id="undefined_edge_node",
+        ),
+        pytest.param(
+            """
 namespace InvalidPropertyTest;
 
 node Person {
     name: String
     age: NotAValidType
 }
-""")
-
+""",
+            "invalid_property.gm",
+            "unknown type",
+            id="invalid_property_type",
+        ),
+    ]
+
+    @pytest.mark.parametrize("source,path,expected", INVALID_DOCUMENT_CASES)
+    def test_invalid_document(self, validator, source, path, expected):
+        """Test validation detects duplicate, unknown and undefined references."""
         # Load the AST
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
+        loaded_asts = _load_source(source, path)
 
         # Validate the AST
-        validator = AstValidator()
         validation_result = validator.validate(loaded_asts)
 
-        # Should be invalid with error about unknown type
+        # Should be invalid with an error about the problem
         assert not validation_result.is_valid
         assert len(validation_result.errors) > 0
-        assert any("unknown type" in err.lower() for err in validation_result.errors)
-
-    def test_valid_primitive_types(self, setup_test_files):
-        """Test validation accepts all valid primitive types."""
-        test_file_path = os.path.join(setup_test_files, "valid_primitives.gm")
-
-        # Create a test file with all primitive types
-        with open(test_file_path, "w") as f:
-            f.write("""
-namespace PrimitiveTypesTest;
-
-node TestPrimitives {
-    stringValue: String
-    intValue: Integer
-    floatValue: Float
-    boolValue: Boolean
-    dateValue: Date
-}
-""")
+        assert expected in "\n".join(validation_result.errors).lower()
 
-        # Load the AST
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
-
-        # Validate the AST
-        validator = AstValidator()
-        validation_result = validator.validate(loaded_asts)
-
-        # Should be valid with no errors
-        assert validation_result.is_valid
-        assert len(validation_result.errors) == 0
-
-    def test_cyclic_type_references(self, setup_test_files):
+    def test_cyclic_type_references(self):
         """Test validation detects cyclic type references."""
-        test_file_path = os.path.join(setup_test_files, "cyclic_types.gm")
-
-        # Create a test file with cyclic type references
-        with open(test_file_path, "w") as f:
-            f.write("""
+        # A model with cyclic type references
+        source = """
 namespace CyclicTypeTest;
 
 type Person {
@@ -812,11 +899,10 @@ type ContactInfo {
     email: String
     owner: Person  // Cyclic reference
 }
-""")
+"""
 
         # Load the AST
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
+        loaded_asts = _load_source(source, "cyclic_types.gm")
 
         # Validate the AST
         validator = AstValidator()
@@ -825,41 +911,22 @@ type ContactInfo {
         # Should be invalid with error about cyclic references
         assert not validation_result.is_valid
         assert len(validation_result.errors) > 0
-        assert any("cyclic" in err.lower() for err in validation_result.errors)
+        assert "cyclic" in "\n".join(validation_result.errors).lower()
 
-    def test_valid_with_imports(self, setup_test_files):
+    def test_valid_with_imports(self, setup_test_files, include_loader, write_files):
         """Test validation with valid imports."""
-        base_file_path = os.path.join(setup_test_files, "base_types.gm")
-        main_file_path = os.path.join(setup_test_files, "main_model_valid.gm")
-
-        # Create base file with types
-        with open(base_file_path, "w") as f:
-            f.write("""
-namespace BaseTypes;
-
-type Location {
-    name: String
-    latitude: Float
-    longitude: Float
-}
-""")
-
-        # Create main file that imports the base file and uses types correctly
-        with open(main_file_path, "w") as f:
-            f.write(f"""
-namespace MainModel;
-
-import "{os.path.basename(base_file_path)}";
-
-node Person {{
-    name: String
-    home: BaseTypes.Location
-}}
-""")
+        base_file_path = setup_test_files / "base_types.gm"
+        main_file_path = setup_test_files / "main_model_valid.gm"
+
+        # Create the base file with types and a main file that imports it and
+        # uses its types correctly
+        write_files(
+            setup_test_files,
+            {base_file_path: _SRC_BASE_TYPES, main_file_path: _SRC_MAIN_VALID},
+        )
 
         # Load the AST with import resolution
-        loader = AstLoader(include_paths=[setup_test_files])
-        loaded_asts = loader.load(main_file_path)
+        loaded_asts = include_loader([setup_test_files]).load(main_file_path)
 
         # Validate the AST
         validator = AstValidator()
@@ -869,37 +936,25 @@ node Person {{
         assert validation_result.is_valid
         assert len(validation_result.errors) == 0
 
-    def test_invalid_import_reference(self, setup_test_files):
+    def test_invalid_import_reference(
+        self, setup_test_files, include_loader, write_files
+    ):
         """Test validation with invalid import references."""
-        base_file_path = os.path.join(setup_test_files, "base_types_invalid.gm")
-        main_file_path = os.path.join(setup_test_files, "main_model_invalid.gm")
-
-        # Create base file with types
-        with open(base_file_path, "w") as f:
-            f.write("""
-namespace BaseTypes;
-
-type Location {
-    name: String
-}
-""")
-
-        # Create main file that imports the base file but uses non-existent type
-        with open(main_file_path, "w") as f:
-            f.write(f"""
-namespace MainModel;
-
-import "{os.path.basename(base_file_path)}";
-
-node Person {{
-    name: String
-    home: BaseTypes.Address  // Address doesn't exist in BaseTypes
-}}
-""")
+        base_file_path = setup_test_files / "base_types_invalid.gm"
+        main_file_path = setup_test_files / "main_model_invalid.gm"
+
+        # Create the base file with types and a main file that imports it but
+        # uses a non-existent type
+        write_files(
+            setup_test_files,
+            {
+                base_file_path: _SRC_BASE_TYPES_LOCATION_ONLY,
+                main_file_path: _SRC_MAIN_INVALID,
+            },
+        )
 
         # Load the AST with import resolution
-        loader = AstLoader(include_paths=[setup_test_files])
-        loaded_asts = loader.load(main_file_path)
+        loaded_asts = include_loader([setup_test_files]).load(main_file_path)
 
         # Validate the AST
         validator = AstValidator()
@@ -913,106 +968,24 @@ node Person {{
             for err in validation_result.errors
         )
 
-    def test_import_file_not_found(self, setup_test_files):
+    def test_import_file_not_found(
+        self, setup_test_files, include_loader, write_fixture
+    ):
         """Test validation with non-existent import file."""
-        main_file_path = os.path.join(setup_test_files, "main_model_not_found.gm")
+        main_file_path = setup_test_files / "main_model_not_found.gm"
 
         # Create main file that imports non-existent file
-        with open(main_file_path, "w") as f:
-            f.write("""
-namespace MainModel;
-
-import "NonExistentFile.gm";
-
-node Person {
-    name: String
-}
-""")
+        write_fixture(main_file_path, _SRC_MAIN_MISSING_IMPORT)
 
         # Load the AST with import resolution
-        loader = AstLoader(include_paths=[setup_test_files])
-
         # Should raise an exception for file not found
         with pytest.raises(Exception):
-            loaded_asts = loader.load(main_file_path)
-
-    def test_complex_validation_scenario(self, setup_test_files):
-        """Test validation with a complex scenario involving multiple types and relationships."""
-        test_file_path = os.path.join(setup_test_files, "complex_validation.gm")
-
-        # Create a test file with complex validation scenario
-        with open(test_file_path, "w") as f:
-            f.write("""
-namespace ComplexValidation;
-
-type Address {
-    street: String
-    city: String
-    country: String
-}
-
-type ContactInfo {
-    email: String
-    phone: String
-}
-
-node Person {
-    firstName: String
-    lastName: String
-    birthDate: Date
-    address: Address
-    contact: ContactInfo
-}
-
-node Organization {
-    name: String
-    founded: Date
-    address: Address
-}
-
-node Department {
-    name: String
-    budget: Float
-}
-
-edge BelongsTo: Department -> Organization {}
-
-edge WorksIn: Person -> Department {
-    role: String
-    since: Date
-}
-
-edge WorksFor: Person -> Organization {
-    position: String
-    salary: Float
-}
-
-edge LivesAt: Person -> Address {}
-
-edge Knows: Person <-> Person {
-    since: Date
-}
-""")
-
-        # Load the AST
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
-
-        # Validate the AST
-        validator = AstValidator()
-        validation_result = validator.validate(loaded_asts)
-
-        # Should be valid with no errors
-        assert validation_result.is_valid
-        assert len(validation_result.errors) == 0
+            loaded_asts = include_loader([setup_test_files]).load(main_file_path)
 
-    def test_edge_between_node_and_complex_type(self, setup_test_files):
+    def test_edge_between_node_and_complex_type(self):
         """Test validation detects invalid edge between node and complex type."""
-        test_file_path = os.path.join(setup_test_files, "invalid_edge_type.gm")
-
-        # Create a test file with edge between node and complex type
-        with open(test_file_path, "w") as f:
-            f.write("""
+        # A model with edge between node and complex type
+        source = """
 namespace InvalidEdgeType;
 
 type Address {
@@ -1025,11 +998,10 @@ node Person {
 }
 
 edge LivesAt: Person -> Address {}  // Invalid: edge can only connect nodes
-""")
+"""
 
         # Load the AST
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
+        loaded_asts = _load_source(source, "invalid_edge_type.gm")
 
         # Validate the AST
         validator = AstValidator()
@@ -1043,13 +1015,10 @@ edge LivesAt: Person -> Address {}  // Invalid: edge can only connect nodes
             for err in validation_result.errors
         )
 
-    def test_duplicate_property_names(self, setup_test_files):
+    def test_duplicate_property_names(self):
         """Test validation detects duplicate property names within a declaration."""
-        test_file_path = os.path.join(setup_test_files, "duplicate_properties.gm")
-
-        # Create a test file with duplicate property names
-        with open(test_file_path, "w") as f:
-            f.write("""
+        # A model with duplicate property names
+        source = """
 namespace DuplicatePropertyTest;
 
 node Person {
@@ -1057,11 +1026,10 @@ node Person {
     age: Integer
     name: String  // Duplicate property name
 }
-""")
+"""
 
         # Load the AST
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
+        loaded_asts = _load_source(source, "duplicate_properties.gm")
 
         # Validate the AST
         validator = AstValidator()
@@ -1070,69 +1038,30 @@ node Person {
         # Should be invalid with error about duplicate property
         assert not validation_result.is_valid
         assert len(validation_result.errors) > 0
-        assert any(
-            "duplicate property" in err.lower() for err in validation_result.errors
-        )
+        assert "duplicate property" in "\n".join(validation_result.errors).lower()
 
-    def test_complex_type_imported_validation(self, setup_test_files):
+    @pytest.mark.slow
+    def test_complex_type_imported_validation(
+        self, setup_test_files, include_loader, write_files
+    ):
         """Test validation of complex types across import boundaries."""
-        base_file_path = os.path.join(setup_test_files, "types_module.gm")
-        nodes_file_path = os.path.join(setup_test_files, "nodes_module.gm")
-        edges_file_path = os.path.join(setup_test_files, "edges_module.gm")
-
-        # Create base types file
-        with open(base_file_path, "w") as f:
-            f.write("""
-namespace Types;
-
-type Location {
-    latitude: Float
-    longitude: Float
-    name: String
-}
-
-type ContactInfo {
-    email: String
-    phone: String
-}
-""")
-
-        # Create nodes file that imports types
-        with open(nodes_file_path, "w") as f:
-            f.write(f"""
-namespace Nodes;
-
-import "{os.path.basename(base_file_path)}";
-
-node Person {{
-    firstName: String
-    lastName: String
-    contact: Types.ContactInfo
-    homeLocation: Types.Location
-}}
-
-node Place {{
-    name: String
-    location: Types.Location
-}}
-""")
-
-        # Create edges file that imports nodes
-        with open(edges_file_path, "w") as f:
-            f.write(f"""
-namespace Edges;
-
-import "{os.path.basename(nodes_file_path)}";
-
-edge VisitedPlace: Nodes.Person -> Nodes.Place {{
-    visitDate: Date
-    rating: Integer
-}}
-""")
+        base_file_path = setup_test_files / "types_module.gm"
+        nodes_file_path = setup_test_files / "nodes_module.gm"
+        edges_file_path = setup_test_files / "edges_module.gm"
+
+        # Create the base types file, a nodes file that imports the types and an
+        # edges file that imports the nodes
+        write_files(
+            setup_test_files,
+            {
+                base_file_path: _SRC_TYPES_MODULE,
+                nodes_file_path: _SRC_NODES_MODULE,
+                edges_file_path: _SRC_EDGES_MODULE,
+            },
+        )
 
         # Load the ASTs with import resolution
-        loader = AstLoader(include_paths=[setup_test_files])
-        loaded_asts = loader.load(
+        loaded_asts = include_loader([setup_test_files]).load(
             edges_file_path
         )  # This will load all imports recursively
 
@@ -1144,24 +1073,20 @@ edge VisitedPlace: Nodes.Person -> Nodes.Place {{
         assert validation_result.is_valid
         assert len(validation_result.errors) == 0
 
-    def test_reserved_words(self, setup_test_files):
+    def test_reserved_words(self):
         """Test validation detects use of reserved words as identifiers."""
-        test_file_path = os.path.join(setup_test_files, "reserved_words.gm")
-
-        # Create a test file using reserved words
-        with open(test_file_path, "w") as f:
-            f.write("""
+        # A model using reserved words
+        source = """
 namespace ReservedWordsTest;
 
 node node {  // 'node' is a reserved word
     type: String  // 'type' is a reserved word
     edge: Integer  // 'edge' is a reserved word
 }
-""")
+"""
 
         # Load the AST
-        loader = AstLoader()
-        loaded_asts = loader.load(test_file_path)
+        loaded_asts = _load_source(source, "reserved_words.gm")
 
         # Validate the AST
         validator = AstValidator()
@@ -1170,7 +1095,7 @@ node node {  // 'node' is a reserved word
         # Should be invalid with error about reserved words
         assert not validation_result.is_valid
         assert len(validation_result.errors) > 0
-        assert any("reserved word" in err.lower() for err in validation_result.errors)
+        assert "reserved word" in "\n".join(validation_result.errors).lower()
 
     def test_programmatic_ast_validation(self):
         """Test validation of a programmatically constructed AST."""
@@ -1218,8 +1143,70 @@ node node {  // 'node' is a reserved word
         assert len(validation_result.errors) == 0
 
 
+# The models the TestModelValidator tests parse, shared at module level rather
+# than rebuilt in each test.
+_SRC_PARSED_MODEL = """\
+namespace Test;
+
+node Person {
+    name: String;
+    age: Integer;
+}
+
+node Company {
+    name: String;
+    founded: Date;
+}
+
+edge WorksAt: Person -> Company {
+    position: String;
+    startDate: Date;
+}
+"""
+
+_SRC_INVALID_PARSED_MODEL = """\
+namespace Test;
+
+node Person {
+    name: String;
+}
+
+# Edge references undefined node
+edge WorksAt: Person -> Organization {
+    position: String;
+}
+"""
+
+_SRC_ARRAYS_AND_NULLABLE = """\
+namespace Test;
+
+node Person {
+    name: String;
+    emails: String[];      # Array of strings
+    phone: String?;        # Nullable string
+    tags: String[]?;       # Nullable array of strings
+}
+
+type Address {
+    street: String;
+    city: String;
+    zipCode: String?;      # Nullable
+}
+
+node Company {
+    name: String;
+    addresses: Address[];  # Array of complex type
+}
+"""
+
+
 class TestModelValidator:
-    def test_validate_basic_model(self):
+    @pytest.fixture(scope="class")
+    def validator(self):
+        """A single ModelValidator shared by all the tests in the class."""
+        return ModelValidator()
+
+    def test_validate_basic_model(self, validator):
         """Test validation of a basic valid model."""
         # Create a simple valid model
         doc = Document(
@@ -1247,13 +1234,12 @@ class TestModelValidator:
         )
 
         # Validate the document
-        validator = ModelValidator()
         errors = validator.validate({"test.gm": doc})
 
         # Should not have any errors
         assert len(errors) == 0
 
-    def test_undefined_node_in_edge(self):
+    def test_undefined_node_in_edge(self, validator):
         """Test validation of an edge referencing undefined nodes."""
         # Create a model with an edge referencing undefined nodes
         doc = Document(
@@ -1280,18 +1266,16 @@ class TestModelValidator:
         )
 
         # Validate the document
-        validator = ModelValidator()
         errors = validator.validate({"test.gm": doc})
 
         # Should have errors for undefined nodes
         assert len(errors) > 0
 
         # Check for specific error messages about undefined nodes
-        error_messages = [str(error) for error in errors]
-        assert any("Company" in msg and "not defined" in msg for msg in error_messages)
-        assert any("User" in msg and "not defined" in msg for msg in error_messages)
+        assert any("Company" in e and "not defined" in e for e in errors)
+        assert any("User" in e and "not defined" in e for e in errors)
 
-    def test_duplicate_names(self):
+    def test_duplicate_names(self, validator):
         """Test validation of duplicate node/edge/type names."""
         # Create a model with duplicate names
         doc = Document(
@@ -1313,22 +1297,16 @@ class TestModelValidator:
         )
 
         # Validate the document
-        validator = ModelValidator()
         errors = validator.validate({"test.gm": doc})
 
         # Should have errors for duplicate names
         assert len(errors) > 0
 
         # Check for specific error messages about duplicate names
-        error_messages = [str(error) for error in errors]
-        assert any(
-            "duplicate" in msg.lower() and "Person" in msg for msg in error_messages
-        )
-        assert any(
-            "duplicate" in msg.lower() and "WorksAt" in msg for msg in error_messages
-        )
+        assert any("Person" in e and "Duplicate" in e for e in errors)
+        assert any("WorksAt" in e and "Duplicate" in e for e in errors)
 
-    def test_invalid_property_types(self):
+    def test_invalid_property_types(self, validator):
         """Test validation of properties with invalid types."""
         # Create a model with invalid property types
         doc = Document(
@@ -1351,22 +1329,16 @@ class TestModelValidator:
         )
 
         # Validate the document
-        validator = ModelValidator()
         errors = validator.validate({"test.gm": doc})
 
         # Should have errors for invalid types
         assert len(errors) > 0
 
         # Check for specific error messages about invalid types
-        error_messages = [str(error) for error in errors]
-        assert any(
-            "Int" in msg and "not a valid" in msg.lower() for msg in error_messages
-        )
-        assert any(
-            "Address" in msg and "not defined" in msg.lower() for msg in error_messages
-        )
+        assert any("Int" in e and "not a valid" in e for e in errors)
+        assert any("Address" in e and "not defined" in e for e in errors)
 
-    def test_valid_property_types(self):
+    def test_valid_property_types(self, validator):
         """Test validation of all valid scalar property types."""
         # Create a model with all valid scalar types
         doc = Document(
@@ -1389,13 +1361,12 @@ class TestModelValidator:
         )
 
         # Validate the document
-        validator = ModelValidator()
         errors = validator.validate({"test.gm": doc})
 
         # Should not have any errors for valid types
         assert len(errors) == 0
 
-    def test_cross_namespace_references(self):
+    def test_cross_namespace_references(self, validator):
         """Test validation of cross-namespace references."""
         # Create two documents with cross-namespace references
         doc1 = Document(
@@ -1439,13 +1410,12 @@ class TestModelValidator:
         )
 
         # Validate both documents
-        validator = ModelValidator()
         errors = validator.validate({"models.gm": doc1, "application.gm": doc2})
 
         # Should not have errors for valid cross-namespace references
         assert len(errors) == 0
 
-    def test_invalid_cross_namespace_references(self):
+    def test_invalid_cross_namespace_references(self, validator):
         """Test validation of invalid cross-namespace references."""
         # Create documents with invalid cross-namespace references
         doc1 = Document(
@@ -1476,20 +1446,15 @@ class TestModelValidator:
         )
 
         # Validate both documents
-        validator = ModelValidator()
         errors = validator.validate({"models.gm": doc1, "application.gm": doc2})
 
         # Should have errors for invalid cross-namespace references
         assert len(errors) > 0
 
         # Check for specific error messages
-        error_messages = [str(error) for error in errors]
-        assert any(
-            "Models.Address" in msg and "not defined" in msg.lower()
-            for msg in error_messages
-        )
+        assert any("Models.Address" in e and "not defined" in e for e in errors)
 
-    def test_validate_circular_references(self):
+    def test_validate_circular_references(self, validator):
         """Test validation of models with circular references."""
         # Create a model with circular type references
         doc = Document(
@@ -1516,13 +1481,12 @@ class TestModelValidator:
         )
 
         # Circular references should be allowed in a graph model
-        validator = ModelValidator()
         errors = validator.validate({"test.gm": doc})
 
         # No errors expected for circular references in a graph model
         assert len(errors) == 0
 
-    def test_namespace_conflicts(self):
+    def test_namespace_conflicts(self, validator):
         """Test validation of namespace conflicts."""
         # Create multiple documents with the same namespace
         doc1 = Document(
@@ -1538,22 +1502,18 @@ class TestModelValidator:
         )
 
         # Validate documents
-        validator = ModelValidator()
         errors = validator.validate({"doc1.gm": doc1, "doc2.gm": doc2})
 
         # Should have errors for duplicate namespaces
         assert len(errors) > 0
 
         # Check for specific error messages
-        error_messages = [str(error) for error in errors]
         assert any(
-            "namespace" in msg.lower()
-            and "Common" in msg
-            and "already defined" in msg.lower()
-            for msg in error_messages
+            "Namespace" in e and "Common" in e and "already defined" in e
+            for e in errors
         )
 
-    def test_missing_imports(self):
+    def test_missing_imports(self, validator):
         """Test validation of missing imports."""
         # Create a document referencing another namespace without importing it
         doc = Document(
@@ -1571,19 +1531,15 @@ class TestModelValidator:
         )
 
         # Validate document
-        validator = ModelValidator()
         errors = validator.validate({"app.gm": doc})
 
         # Should have errors for missing imports
         assert len(errors) > 0
 
         # Check for specific error messages
-        error_messages = [str(error) for error in errors]
-        assert any(
-            "Models" in msg and "not imported" in msg.lower() for msg in error_messages
-        )
+        assert any("Models" in e and "not imported" in e for e in errors)
 
-    def test_duplicate_property_names(self):
+    def test_duplicate_property_names(self, validator):
         """Test validation of duplicate property names."""
         # Create a model with duplicate property names
         doc = Document(
@@ -1603,127 +1559,67 @@ class TestModelValidator:
         )
 
         # Validate document
-        validator = ModelValidator()
         errors = validator.validate({"test.gm": doc})
 
         # Should have errors for duplicate property names
         assert len(errors) > 0
 
         # Check for specific error messages
-        error_messages = [str(error) for error in errors]
-        assert any(
-            "name" in msg and "duplicate" in msg.lower() for msg in error_messages
-        )
+        assert any("name" in e and "Duplicate" in e for e in errors)
 
-    def test_validate_parsed_model(self):
+    def test_validate_parsed_model(self, validator):
         """Test validation of a model parsed from string."""
         # Parse a model from string
-        parser = Parser()
-        doc = parser.parse("""
-        namespace Test;
-        
-        node Person {
-            name: String;
-            age: Integer;
-        }
-        
-        node Company {
-            name: String;
-            founded: Date;
-        }
-        
-        edge WorksAt: Person -> Company {
-            position: String;
-            startDate: Date;
-        }
-        """)
+        doc = _parse(_SRC_PARSED_MODEL)
 
         # Validate the parsed document
-        validator = ModelValidator()
         errors = validator.validate({"test.gm": doc})
 
         # Should not have any errors
         assert len(errors) == 0
 
-    def test_validate_invalid_parsed_model(self):
+    def test_validate_invalid_parsed_model(self, validator):
         """Test validation of an invalid model parsed from string."""
         # Parse an invalid model from string
-        parser = Parser()
-        doc = parser.parse("""
-        namespace Test;
-        
-        node Person {
-            name: String;
-        }
-        
-        # Edge references undefined node
-        edge WorksAt: Person -> Organization {
-            position: String;
-        }
-        """)
+        doc = _parse(_SRC_INVALID_PARSED_MODEL)
 
         # Validate the parsed document
-        validator = ModelValidator()
         errors = validator.validate({"test.gm": doc})
 
         # Should have errors for undefined node
         assert len(errors) > 0
 
         # Check for specific error messages
-        error_messages = [str(error) for error in errors]
-        assert any(
-            "Organization" in msg and "not defined" in msg.lower()
-            for msg in error_messages
-        )
+        assert any("Organization" in e and "not defined" in e for e in errors)
 
-    def test_arrays_and_nullable_types(self):
+    def test_arrays_and_nullable_types(self, validator):
         """Test validation of array and nullable types."""
         # Parse a model with array and nullable types
-        parser = Parser()
-        doc = parser.parse("""
-        namespace Test;
-        
-        node Person {
-            name: String;
-            emails: String[];      # Array of strings
-            phone: String?;        # Nullable string
-            tags: String[]?;       # Nullable array of strings
-        }
-        
-        type Address {
-            street: String;
-            city: String;
-            zipCode: String?;      # Nullable
-        }
-        
-        node Company {
-            name: String;
-            addresses: Address[];  # Array of complex type
-        }
-        """)
+        doc = _parse(_SRC_ARRAYS_AND_NULLABLE)
 
         # Validate the parsed document
-        validator = ModelValidator()
         errors = validator.validate({"test.gm": doc})
 
         # Should not have any errors
         assert len(errors) == 0
 
-    def test_validation_with_imports(self, parser, tmpdir):
+    def test_validation_with_imports(self, validator, tmp_path, write_files):
         """Test validation of a model with imports."""
         # Create temporary files for testing
-        base_file = tmpdir.join("base.gm")
-        base_file.write("""
+        base_file = tmp_path / "base.gm"
+        main_file = tmp_path / "main.gm"
+        write_files(
+            tmp_path,
+            {
+                base_file: """
         namespace Base;
         
         type Address {
             street: String;
             city: String;
         }
-        """)
-
-        main_file = tmpdir.join("main.gm")
-        main_file.write(f"""
+        """,
+                main_file: f"""
         namespace Main;
         
         import "{base_file}";
@@ -1732,14 +1628,15 @@ class TestModelValidator:
             name: String;
             address: Base.Address;
         }}
-        """)
+        """,
+            },
+        )
 
         # Parse files
-        base_doc = parser.parse_file(str(base_file))
-        main_doc = parser.parse_file(str(main_file))
+        base_doc = _shared_parser.parse_file(str(base_file))
+        main_doc = _shared_parser.parse_file(str(main_file))
 
         # Validate documents
-        validator = ModelValidator()
         errors = validator.validate(
             {str(base_file): base_doc, str(main_file): main_doc}
         )
@@ -0,0 +1,51 @@
+# Copyright 2025 Savas Parastatidis
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from gmdsl.loader import AstLoader
+from gmdsl.validation import ValidationError, validate_asts
+
+_SRC_DUPLICATES = """namespace Ex
+node P {
+  name: String
+  name: String
+}
+edge F(P <-> P)
+edge F(P -> P)
+"""
+
+
+class TestValidationErrors:
+    def test_validation_error_contains(self):
+        """Test substring checks against a ValidationError's message."""
+        error = ValidationError(
+            message="Undefined target node 'Company' in edge 'WorksAt'",
+            source_path="model.gm",
+        )
+
+        assert "Company" in error
+        assert "Undefined target node" in error
+        assert "model.gm" not in error
+        assert "company" not in error
+
+    def test_duplicate_edge_and_property(self, tmp_path, write_fixture):
+        """Test that duplicate edges and duplicate properties are reported."""
+        model_path = tmp_path / "duplicates.gm"
+        write_fixture(model_path, _SRC_DUPLICATES)
+
+        errors = validate_asts(AstLoader().load(str(model_path)))
+        messages = [error.message for error in errors]
+
+        assert "Duplicate edge definition: 'Ex.F'" in messages
+        assert "Duplicate property 'name' in 'Ex.P'" in messages
+        assert all(error.source_path == str(model_path) for error in errors)